@@ -0,0 +1,28 @@
+"""
+Optional Numba support.
+
+Numba is not a hard dependency of this package. Kernels are decorated with the `njit` exported here, which
+is `numba.njit` when Numba is installed and a no-op otherwise. Callers check `HAS_NUMBA` to decide whether
+running a kernel is worth it compared to the equivalent pandas/NumPy expression.
+"""
+
+try:
+    from numba import njit, prange, set_num_threads  # type: ignore[import-not-found, import-untyped]
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def set_num_threads(n):  # type: ignore[no-redef]
+        """Stand-in for `numba.set_num_threads`; without Numba everything is single-threaded."""
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """Stand-in for `numba.njit` that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+__all__ = ['HAS_NUMBA', 'njit', 'prange', 'set_num_threads']
@@ -1,12 +1,330 @@
+import hashlib
 import logging
+import threading
+import numpy as np
 import pandas as pd
-from typing import List, Dict
+from collections import OrderedDict
+from typing import List, Dict, Tuple, Union
+
+from ._njit import HAS_NUMBA, njit, prange
+
+try:
+    import talib  # type: ignore[import-not-found, import-untyped]
+except ImportError:  # TA-Lib is optional, fall back to pandas' ewm
+    talib = None
+
+try:
+    import bottleneck  # type: ignore[import-not-found, import-untyped]
+except ImportError:  # bottleneck is optional, fall back to NumPy windows
+    bottleneck = None
+
+try:
+    import numexpr  # type: ignore[import-not-found, import-untyped]
+except ImportError:  # numexpr is optional, fall back to NumPy
+    numexpr = None
 
 # Initialize logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
+@njit(cache=True)
+def _ema_step(weighted: float, old_wt: float, cur: float, alpha: float) -> Tuple[float, float]:
+    """Advance the `adjust=False` EWM state `(weighted, old_wt)` by one observation, as pandas does."""
+    if weighted == weighted:
+        old_wt *= 1.0 - alpha
+        if cur == cur:
+            if weighted != cur:
+                weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+            old_wt = 1.0
+    elif cur == cur:
+        weighted = cur
+    return weighted, old_wt
+
+
+@njit(cache=True)
+def _ema_kernel(values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Single-pass EMA recurrence reproducing `Series.ewm(alpha=alpha, adjust=False).mean()`.
+
+    Leading NaNs stay NaN; a NaN inside the series carries the previous value forward and
+    is accounted for when the next observation is blended in, exactly as pandas does.
+    """
+    n = values.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    weighted = np.nan
+    old_wt = 1.0
+    for i in range(n):
+        weighted, old_wt = _ema_step(weighted, old_wt, values[i], alpha)
+        out[i] = weighted
+    return out
+
+
+def _ema_from_array(values: np.ndarray, window: int) -> np.ndarray:
+    """EMA with `adjust=False` semantics over a float64 array, using the Numba kernel when it is available."""
+    if HAS_NUMBA:
+        return _ema_kernel(values, 2.0 / (window + 1.0))
+    return pd.Series(values).ewm(span=window, adjust=False).mean().to_numpy()
+
+
+@njit(cache=True)
+def _rsi_kernel(close: np.ndarray, period: int) -> np.ndarray:
+    """
+    Single-pass RSI with Wilder's smoothing.
+
+    The average gain/loss are seeded with the simple mean of the first `period` valid price changes and then
+    updated as `avg = (avg * (period - 1) + current) / period`. Entries before the seed and entries whose
+    price change involves a NaN price are NaN; such changes are skipped by the averages. The RSI is 100
+    when the average loss is zero and the average gain is not, and NaN when both are zero (a flat price).
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    count = 0
+    for i in range(1, n):
+        change = close[i] - close[i - 1]
+        if change != change:
+            continue
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        count += 1
+        if count <= period:
+            avg_gain += gain
+            avg_loss += loss
+            if count < period:
+                continue
+            avg_gain /= period
+            avg_loss /= period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        if avg_loss != 0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            out[i] = 100.0
+    return out
+
+
+def _rsi_from_array(close: np.ndarray, period: int) -> np.ndarray:
+    """Wilder RSI over a float64 array, using the Numba kernel when it is available."""
+    if period < 1:
+        raise ValueError(f"RSI window must be >= 1, got {period}")
+    if HAS_NUMBA:
+        return _rsi_kernel(close, period)
+
+    out = np.full(close.shape[0], np.nan)
+    delta = np.diff(close)
+    # Only changes between two valid prices enter the averages; the others stay NaN in the output
+    valid = np.flatnonzero(~np.isnan(delta))
+    if valid.shape[0] < period:
+        return out
+
+    # Wilder's smoothing is an adjust=False EWM with alpha = 1 / period, seeded with the simple mean
+    delta = delta[valid]
+    averages = []
+    for changes in (np.clip(delta, 0, None), np.clip(-delta, 0, None)):
+        seeded = changes[period - 1:].copy()
+        seeded[0] = changes[:period].mean()
+        averages.append(pd.Series(seeded).ewm(alpha=1.0 / period, adjust=False).mean().to_numpy())
+    avg_gain, avg_loss = averages
+    # Gains without losses give avg_gain / 0 = inf and so RSI 100; a flat stretch gives 0 / 0 and stays NaN
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    out[valid[period - 1:] + 1] = rsi
+    return out
+
+
+@njit(cache=True)
+def _strategy_kernel(close: np.ndarray, values: np.ndarray, volume: np.ndarray, short_window: int,
+                     long_window: int, signal_window: int, bb_window: int, num_std: float, rsi_window: int,
+                     volume_window: int):
+    """
+    Fused single pass over the price and volume buffers producing every series `apply_strategy` needs.
+
+    Keeps the fast/slow/signal EMA states, a Welford mean/M2 over the trailing Bollinger window, a
+    trailing volume sum and Wilder's average gain/loss, and emits the Buy/Sell signals inline. Each
+    output matches the corresponding standalone indicator: MACD/Signal_Line as in `compute_macd`
+    without TA-Lib, Bollinger bands as in `compute_bollinger_bands` and RSI as in `compute_rsi`.
+    The float outputs take the dtype of `close`; the running state is kept in float64.
+    """
+    n = close.shape[0]
+    macd = np.empty(n, dtype=close.dtype)
+    signal = np.empty(n, dtype=close.dtype)
+    bb_mid = np.full(n, np.nan, dtype=close.dtype)
+    bb_upper = np.full(n, np.nan, dtype=close.dtype)
+    bb_lower = np.full(n, np.nan, dtype=close.dtype)
+    rsi = np.full(n, np.nan, dtype=close.dtype)
+    buy = np.zeros(n, dtype=np.bool_)
+    sell = np.zeros(n, dtype=np.bool_)
+
+    alpha_short = 2.0 / (short_window + 1.0)
+    alpha_long = 2.0 / (long_window + 1.0)
+    alpha_signal = 2.0 / (signal_window + 1.0)
+    ema_short, wt_short = np.nan, 1.0
+    ema_long, wt_long = np.nan, 1.0
+    ema_signal, wt_signal = np.nan, 1.0
+    bb_count, bb_mean, bb_m2 = 0, 0.0, 0.0
+    volume_count, volume_sum = 0, 0.0
+    avg_gain, avg_loss, rsi_count = 0.0, 0.0, 0
+
+    for i in range(n):
+        ema_short, wt_short = _ema_step(ema_short, wt_short, close[i], alpha_short)
+        ema_long, wt_long = _ema_step(ema_long, wt_long, close[i], alpha_long)
+        macd_i = ema_short - ema_long
+        ema_signal, wt_signal = _ema_step(ema_signal, wt_signal, macd_i, alpha_signal)
+        macd[i] = macd_i
+        signal[i] = ema_signal
+
+        # Bollinger Bands: add the newest valid value, drop the one leaving the window
+        x = values[i]
+        if x == x:
+            bb_count += 1
+            delta = x - bb_mean
+            bb_mean += delta / bb_count
+            bb_m2 += delta * (x - bb_mean)
+        if i >= bb_window:
+            y = values[i - bb_window]
+            if y == y:
+                bb_count -= 1
+                if bb_count == 0:
+                    bb_mean, bb_m2 = 0.0, 0.0
+                else:
+                    delta = y - bb_mean
+                    bb_mean -= delta / bb_count
+                    bb_m2 -= delta * (y - bb_mean)
+        upper_i, lower_i = np.nan, np.nan
+        if bb_count == bb_window:
+            bb_mid[i] = bb_mean
+            if bb_window > 1:
+                band = num_std * np.sqrt(max(bb_m2, 0.0) / (bb_window - 1))
+                upper_i = bb_mean + band
+                lower_i = bb_mean - band
+        bb_upper[i] = upper_i
+        bb_lower[i] = lower_i
+
+        v = volume[i]
+        if v == v:
+            volume_count += 1
+            volume_sum += v
+        if i >= volume_window:
+            u = volume[i - volume_window]
+            if u == u:
+                volume_count -= 1
+                volume_sum -= u
+        volume_ma = volume_sum / volume_window if volume_count == volume_window else np.nan
+
+        # RSI: changes involving a NaN price are skipped and leave the RSI NaN, as in `_rsi_kernel`
+        rsi_i = np.nan
+        change = values[i] - values[i - 1] if i >= 1 else np.nan
+        if change == change:
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            rsi_count += 1
+            if rsi_count <= rsi_window:
+                avg_gain += gain
+                avg_loss += loss
+                if rsi_count == rsi_window:
+                    avg_gain /= rsi_window
+                    avg_loss /= rsi_window
+            else:
+                avg_gain = (avg_gain * (rsi_window - 1) + gain) / rsi_window
+                avg_loss = (avg_loss * (rsi_window - 1) + loss) / rsi_window
+            if rsi_count >= rsi_window:
+                if avg_loss != 0:
+                    rsi_i = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+                elif avg_gain > 0:
+                    rsi_i = 100.0
+        rsi[i] = rsi_i
+
+        # Signals compare the full-precision values, so float32 outputs do not shift them
+        buy[i] = macd_i > ema_signal and close[i] > lower_i and rsi_i < 70 and v > volume_ma
+        sell[i] = macd_i < ema_signal and close[i] < upper_i and rsi_i > 30
+
+    return macd, signal, bb_mid, bb_upper, bb_lower, rsi, buy, sell
+
+
+@njit(cache=True, parallel=True)
+def _strategy_batch_kernel(close: np.ndarray, values: np.ndarray, volume: np.ndarray, offsets: np.ndarray,
+                           short_window: int, long_window: int, signal_window: int, bb_window: int, num_std: float,
+                           rsi_window: int, volume_window: int):
+    """
+    `_strategy_kernel` over several concatenated histories, one history per parallel iteration.
+
+    History `j` occupies `offsets[j]:offsets[j + 1]` of the input and output buffers; the histories share no
+    state, so they are processed independently across threads.
+    """
+    n = close.shape[0]
+    macd = np.empty(n, dtype=close.dtype)
+    signal = np.empty(n, dtype=close.dtype)
+    bb_mid = np.empty(n, dtype=close.dtype)
+    bb_upper = np.empty(n, dtype=close.dtype)
+    bb_lower = np.empty(n, dtype=close.dtype)
+    rsi = np.empty(n, dtype=close.dtype)
+    buy = np.empty(n, dtype=np.bool_)
+    sell = np.empty(n, dtype=np.bool_)
+    for j in prange(offsets.shape[0] - 1):
+        start, stop = offsets[j], offsets[j + 1]
+        results = _strategy_kernel(close[start:stop], values[start:stop], volume[start:stop], short_window,
+                                   long_window, signal_window, bb_window, num_std, rsi_window, volume_window)
+        macd[start:stop] = results[0]
+        signal[start:stop] = results[1]
+        bb_mid[start:stop] = results[2]
+        bb_upper[start:stop] = results[3]
+        bb_lower[start:stop] = results[4]
+        rsi[start:stop] = results[5]
+        buy[start:stop] = results[6]
+        sell[start:stop] = results[7]
+    return macd, signal, bb_mid, bb_upper, bb_lower, rsi, buy, sell
+
+
+def _rolling_mean_std(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Trailing rolling mean and sample standard deviation (ddof=1) over a float64 array.
+
+    Matches `Series.rolling(window).mean()` / `.std()`: the first `window - 1` entries, and any
+    window containing a NaN, are NaN. Uses bottleneck's moving-window functions when installed
+    and pandas' rolling otherwise.
+    """
+    if window < 1:
+        raise ValueError(f"Rolling window must be >= 1, got {window}")
+
+    if bottleneck is not None and window <= values.shape[0]:
+        return (bottleneck.move_mean(values, window, min_count=window),
+                bottleneck.move_std(values, window, min_count=window, ddof=1))
+    rolling = pd.Series(values).rolling(window=window)
+    return rolling.mean().to_numpy(), rolling.std().to_numpy()
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling mean over a float64 array, matching `Series.rolling(window).mean()`."""
+    if bottleneck is not None and 1 <= window <= values.shape[0]:
+        return bottleneck.move_mean(values, window, min_count=window)
+    return pd.Series(values).rolling(window=window).mean().to_numpy()
+
+
+_STRATEGY_COLUMNS = ['MACD', 'Signal_Line', 'Bollinger_Mid', 'Bollinger_Upper', 'Bollinger_Lower',
+                     'RSI', 'Buy_Signal', 'Sell_Signal']
+
+# Indicator parameters `apply_strategy` does not expose; the Bollinger window follows `volume_window`
+_STRATEGY_SIGNAL_WINDOW = 9
+_STRATEGY_NUM_STD = 2
+_STRATEGY_RSI_WINDOW = 14
+
+# Backtests call `apply_strategy` repeatedly on unchanged data; keep the latest results keyed by content
+_STRATEGY_CACHE_SIZE = 8
+_STRATEGY_CACHE: 'OrderedDict[tuple, Dict[str, np.ndarray]]' = OrderedDict()
+_STRATEGY_CACHE_LOCK = threading.Lock()
+
+
+def _strategy_digest(*arrays: np.ndarray) -> str:
+    """Content hash of the given arrays, cheap compared to recomputing the indicators from them."""
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        digest.update(np.ascontiguousarray(array).data)
+    return digest.hexdigest()
+
+
 class AdvancedFinancialIndicator:
     """
     Class to combine multiple financial analysis strategies: Moving Average,
@@ -29,7 +347,7 @@ class AdvancedFinancialIndicator:
         return True
 
     @staticmethod
-    def compute_ema(stock_data: pd.DataFrame, window: int, column: str = 'Close') -> pd.Series:
+    def compute_ema(stock_data: pd.DataFrame, window: int, column: str = 'Close', use_talib: bool = False) -> pd.Series:
         """
         Compute Exponential Moving Average (EMA) for a given column.
 
@@ -37,16 +355,33 @@ class AdvancedFinancialIndicator:
         on the most recent data points. It's commonly used to identify the direction
         of a trend or to determine its strength.
 
+        The `adjust=False` recurrence is evaluated by a Numba kernel when Numba is
+        available, or by pandas' ewm. With `use_talib=True` it runs in TA-Lib's C
+        implementation instead, which seeds the EMA with the simple average of the first
+        `window` values, so the first `window - 1` entries are NaN, and carries a NaN
+        input forward to every later value.
+
         :param stock_data: DataFrame containing stock data.
         :param window: Integer representing the period of the EMA.
         :param column: The column on which EMA is to be computed.
+        :param use_talib: Use TA-Lib's EMA, which gives different values (see above).
         :return: Series containing the computed EMA values.
         """
-        return stock_data[column].ewm(span=window, adjust=False).mean()
+        series = stock_data[column]
+        if window < 1:
+            raise ValueError(f"EMA window must be >= 1, got {window}")
+
+        if use_talib:
+            if talib is None:
+                raise ImportError("TA-Lib is required for use_talib=True")
+            close = np.ascontiguousarray(series.to_numpy(dtype=np.float64, na_value=np.nan))
+            return pd.Series(talib.EMA(close, timeperiod=window), index=stock_data.index, name=column)
+
+        return pd.Series(_ema_from_array(series.to_numpy(dtype=np.float64, na_value=np.nan), window), index=stock_data.index, name=column)
 
     @staticmethod
     def compute_macd(stock_data: pd.DataFrame, short_window: int = 12, long_window: int = 26,
-                     signal_window: int = 9) -> pd.DataFrame:
+                     signal_window: int = 9, use_talib: bool = False) -> pd.DataFrame:
         """
         Compute Moving Average Convergence Divergence (MACD) and Signal Line.
 
@@ -55,20 +390,34 @@ class AdvancedFinancialIndicator:
         the 26-period EMA from the 12-period EMA. The result of that calculation is the
         MACD line. A nine-day EMA of the MACD called the "signal line," is then plotted
         on top of the MACD line, which can function as a trigger for buy and sell signals.
+        The EMAs use the same `adjust=False` recurrence as `compute_ema`.
 
         :param stock_data: DataFrame containing stock data.
         :param short_window: Integer representing the short period EMA.
         :param long_window: Integer representing the long period EMA.
         :param signal_window: Integer representing the signal line EMA.
+        :param use_talib: Use TA-Lib's MACD, whose EMAs are seeded with a simple average (leaving a NaN
+            prefix) and carry a NaN input forward to every later value, so the results differ.
         :return: DataFrame with the MACD and Signal Line added.
         """
         if not AdvancedFinancialIndicator.validate_data(stock_data, ['Close']):
             return stock_data
-
-        stock_data['MACD'] = AdvancedFinancialIndicator.compute_ema(stock_data,
-                                                                    short_window) - AdvancedFinancialIndicator.compute_ema(
-            stock_data, long_window)
-        stock_data['Signal_Line'] = stock_data['MACD'].ewm(span=signal_window, adjust=False).mean()
+        if min(short_window, long_window, signal_window) < 1:
+            raise ValueError(f"MACD windows must be >= 1, got {(short_window, long_window, signal_window)}")
+
+        # Extract Close once; both EMAs and the signal line work on the same float64 buffer
+        close = np.ascontiguousarray(stock_data['Close'].to_numpy(dtype=np.float64, na_value=np.nan))
+        if use_talib:
+            if talib is None:
+                raise ImportError("TA-Lib is required for use_talib=True")
+            macd, signal, _ = talib.MACD(close, fastperiod=short_window, slowperiod=long_window,
+                                         signalperiod=signal_window)
+        else:
+            macd = _ema_from_array(close, short_window) - _ema_from_array(close, long_window)
+            signal = _ema_from_array(macd, signal_window)
+
+        stock_data['MACD'] = macd
+        stock_data['Signal_Line'] = signal
         return stock_data
 
     @staticmethod
@@ -93,11 +442,12 @@ class AdvancedFinancialIndicator:
         if not AdvancedFinancialIndicator.validate_data(stock_data, [column]):
             return stock_data
 
-        rolling_mean = stock_data[column].rolling(window=window).mean()
-        rolling_std = stock_data[column].rolling(window=window).std()
+        rolling_mean, rolling_std = _rolling_mean_std(stock_data[column].to_numpy(dtype=np.float64, na_value=np.nan), window)
+        # The rolling buffers may be read-only views (pandas Copy-on-Write), so the bands get new arrays
+        band_width = rolling_std * num_std
         stock_data['Bollinger_Mid'] = rolling_mean
-        stock_data['Bollinger_Upper'] = rolling_mean + (rolling_std * num_std)
-        stock_data['Bollinger_Lower'] = rolling_mean - (rolling_std * num_std)
+        stock_data['Bollinger_Upper'] = rolling_mean + band_width
+        stock_data['Bollinger_Lower'] = rolling_mean - band_width
         return stock_data
 
     @staticmethod
@@ -110,6 +460,10 @@ class AdvancedFinancialIndicator:
         It is displayed as an oscillator (a line graph that moves between two extremes) and
         can have a reading from 0 to 100. The indicator was originally developed by J. Welles
         Wilder Jr. and introduced in his seminal 1978 book, "New Concepts in Technical Trading Systems."
+        Average gains and losses use Wilder's smoothing, seeded with the simple mean of the first
+        `window` valid price changes, so the values before the seed are NaN. Rows whose price change
+        involves a missing price are NaN and do not enter the averages. A flat price, with no average
+        gain or loss, has no RSI and is NaN.
 
         :param stock_data: DataFrame containing stock data.
         :param window: Integer representing the RSI calculation period.
@@ -119,11 +473,7 @@ class AdvancedFinancialIndicator:
         if not AdvancedFinancialIndicator.validate_data(stock_data, [column]):
             return stock_data
 
-        delta = stock_data[column].diff()
-        gain = (delta.clip(lower=0)).rolling(window=window).mean()
-        loss = (-delta.clip(upper=0)).rolling(window=window).mean()
-        rs = gain / loss
-        stock_data['RSI'] = 100 - (100 / (1 + rs))
+        stock_data['RSI'] = _rsi_from_array(stock_data[column].to_numpy(dtype=np.float64, na_value=np.nan), window)
         return stock_data
 
     @staticmethod
@@ -150,15 +500,24 @@ class AdvancedFinancialIndicator:
         start_date = pd.to_datetime(start_date_str)
         end_date = pd.to_datetime(end_date_str)
 
-        # Filter the DataFrame based on the date range without altering the index
-        mask = (pd.to_datetime(stock_data['Date']) >= start_date) & (pd.to_datetime(stock_data['Date']) <= end_date)
-        relevant_data = stock_data[mask]
-
-        if relevant_data.empty:
+        # Select the date range without altering the index; parse 'Date' only once
+        dates = pd.to_datetime(stock_data['Date'])
+        rows: Union[slice, np.ndarray]
+        if dates.is_monotonic_increasing:
+            # Sorted dates (the usual case) bound the range with two binary searches instead of a full mask
+            first, stop = dates.searchsorted(start_date, side='left'), dates.searchsorted(end_date, side='right')
+            rows = slice(first, stop)
+            found = bool(first < stop)
+        else:
+            mask = ((dates >= start_date) & (dates <= end_date)).to_numpy()
+            rows = mask
+            found = bool(mask.any())
+
+        if not found:
             raise ValueError("No data found for the given date range.")
 
-        high = relevant_data['High'].max()
-        low = relevant_data['Low'].min()
+        high = np.nanmax(stock_data['High'].to_numpy(dtype=np.float64, na_value=np.nan)[rows])
+        low = np.nanmin(stock_data['Low'].to_numpy(dtype=np.float64, na_value=np.nan)[rows])
         diff = high - low
         levels = {
             'Level_0': high,
@@ -173,7 +532,7 @@ class AdvancedFinancialIndicator:
 
     @staticmethod
     def apply_strategy(stock_data: pd.DataFrame, short_window: int, long_window: int, volume_window: int,
-                       column: str = 'Close') -> pd.DataFrame:
+                       column: str = 'Close', use_float32: bool = False, use_talib: bool = False) -> pd.DataFrame:
         """
         Apply a combined strategy on stock data incorporating MACD, Bollinger Bands, RSI, and Fibonacci Retracement.
 
@@ -184,32 +543,155 @@ class AdvancedFinancialIndicator:
         effectiveness of any combined strategy can be subjective and should be validated with historical data
         to ensure reliability.
 
+        When Numba is installed and `use_talib` is not set, all indicators and both signals are produced by a
+        single fused pass over the price and volume data. Otherwise results are
+        memoized by a hash of the input columns and the window sizes, so repeated calls on unchanged data (as
+        in a backtest loop) only copy the cached columns back into the frame. The memo is shared by all
+        threads and guarded by a lock.
+
         :param stock_data: DataFrame with stock data.
         :param short_window: Window size for the short-term EMA.
         :param long_window: Window size for the long-term EMA.
         :param volume_window: Window size for volume averaging.
         :param column: The column on which to perform the analyses.
+        :param use_float32: Read the inputs and store the indicator columns as float32, halving the memory they
+            occupy; float64 columns are converted on the way in. Recursive state (EMA, Wilder averages, rolling
+            sums) is still accumulated in float64.
+        :param use_talib: Compute the MACD with TA-Lib, as in `compute_macd`.
         :return: DataFrame with combined strategy signals.
         """
         if not AdvancedFinancialIndicator.validate_data(stock_data, [column, 'Volume']):
             return stock_data
 
-        # Calculate indicators
-        stock_data = AdvancedFinancialIndicator.compute_macd(stock_data, short_window, long_window)
-        stock_data = AdvancedFinancialIndicator.compute_bollinger_bands(stock_data, volume_window, column=column)
-        stock_data = AdvancedFinancialIndicator.compute_rsi(stock_data, column=column)
+        dtype = np.float32 if use_float32 else np.float64
+        close = stock_data['Close'].to_numpy(dtype=dtype, na_value=np.nan)
+        values = stock_data[column].to_numpy(dtype=dtype, na_value=np.nan)
+        volume = stock_data['Volume'].to_numpy(dtype=dtype, na_value=np.nan)
+        if HAS_NUMBA and not use_talib:
+            # The fused kernel is about as fast as hashing its inputs, so its results are not memoized
+            fused = AdvancedFinancialIndicator._strategy_columns(stock_data, short_window, long_window,
+                                                                 volume_window, column, close, values, volume)
+            for name, result in fused.items():
+                stock_data[name] = result
+            return stock_data
 
-        # Define signals based on combined indicators
-        stock_data['Buy_Signal'] = ((stock_data['MACD'] > stock_data['Signal_Line']) &
-                                    (stock_data['Close'] > stock_data['Bollinger_Lower']) &
-                                    (stock_data['RSI'] < 70) &
-                                    (stock_data['Volume'] > stock_data['Volume'].rolling(window=volume_window).mean()))
+        key = (_strategy_digest(close, values, volume), short_window, long_window, volume_window, use_float32,
+               use_talib)
+        with _STRATEGY_CACHE_LOCK:
+            results = _STRATEGY_CACHE.get(key)
+            if results is not None:
+                _STRATEGY_CACHE.move_to_end(key)
+        if results is None:
+            results = AdvancedFinancialIndicator._strategy_columns(stock_data, short_window, long_window,
+                                                                   volume_window, column, close, values, volume,
+                                                                   use_talib)
+            results = AdvancedFinancialIndicator._strategy_result_dtypes(results, use_float32)
+            with _STRATEGY_CACHE_LOCK:
+                _STRATEGY_CACHE[key] = results
+                if len(_STRATEGY_CACHE) > _STRATEGY_CACHE_SIZE:
+                    _STRATEGY_CACHE.popitem(last=False)
+
+        for name, result in results.items():
+            stock_data[name] = result.copy()
+        return stock_data
 
-        stock_data['Sell_Signal'] = ((stock_data['MACD'] < stock_data['Signal_Line']) &
-                                     (stock_data['Close'] < stock_data['Bollinger_Upper']) &
-                                     (stock_data['RSI'] > 30))
+    @staticmethod
+    def apply_strategy_batch(datasets: Dict[str, pd.DataFrame], short_window: int, long_window: int,
+                             volume_window: int, column: str = 'Close') -> Dict[str, pd.DataFrame]:
+        """
+        Apply `apply_strategy` to several independent histories, e.g. one per ticker.
 
-        return stock_data
+        When the fused kernel is available (Numba installed), all histories are concatenated into one
+        buffer per input column and processed in parallel, one history per thread. Otherwise each history
+        goes through `apply_strategy` in turn. The frames are updated in place, as with `apply_strategy`;
+        frames missing a required column are returned unchanged.
+
+        :param datasets: Mapping of name (e.g. ticker symbol) to DataFrame with stock data.
+        :param short_window: Window size for the short-term EMA.
+        :param long_window: Window size for the long-term EMA.
+        :param volume_window: Window size for volume averaging.
+        :param column: The column on which to perform the analyses.
+        :return: Mapping of the same names to the DataFrames with combined strategy signals.
+        """
+        if not HAS_NUMBA:
+            return {name: AdvancedFinancialIndicator.apply_strategy(data, short_window, long_window, volume_window,
+                                                                    column)
+                    for name, data in datasets.items()}
+
+        if min(short_window, long_window, volume_window) < 1:
+            raise ValueError("Strategy windows must be >= 1")
+        valid = [name for name, data in datasets.items()
+                 if AdvancedFinancialIndicator.validate_data(data, [column, 'Volume'])]
+        if valid:
+            frames = [datasets[name] for name in valid]
+            offsets = np.cumsum([0] + [len(data) for data in frames])
+            close = np.concatenate([data['Close'].to_numpy(dtype=np.float64, na_value=np.nan) for data in frames])
+            values = np.concatenate([data[column].to_numpy(dtype=np.float64, na_value=np.nan) for data in frames])
+            volume = np.concatenate([data['Volume'].to_numpy(dtype=np.float64, na_value=np.nan) for data in frames])
+            results = _strategy_batch_kernel(close, values, volume, offsets, short_window, long_window,
+                                             _STRATEGY_SIGNAL_WINDOW, volume_window, _STRATEGY_NUM_STD,
+                                             _STRATEGY_RSI_WINDOW, volume_window)
+            for data, start, stop in zip(frames, offsets[:-1], offsets[1:]):
+                for name, result in zip(_STRATEGY_COLUMNS, results):
+                    data[name] = result[start:stop].copy()
+        return dict(datasets)
+
+    @staticmethod
+    def _strategy_columns(stock_data: pd.DataFrame, short_window: int, long_window: int, volume_window: int,
+                          column: str, close: np.ndarray, values: np.ndarray,
+                          volume: np.ndarray, use_talib: bool = False) -> Dict[str, np.ndarray]:
+        """Compute the columns `apply_strategy` adds, keyed by column name."""
+        if HAS_NUMBA and not use_talib:
+            if min(short_window, long_window, volume_window) < 1:
+                raise ValueError("Strategy windows must be >= 1")
+            results = _strategy_kernel(close, values, volume,
+                                       short_window, long_window, _STRATEGY_SIGNAL_WINDOW, volume_window,
+                                       _STRATEGY_NUM_STD, _STRATEGY_RSI_WINDOW, volume_window)
+            return dict(zip(_STRATEGY_COLUMNS, results))
+
+        # Work on a separate frame so a failing indicator leaves the caller's frame untouched
+        work = pd.DataFrame({'Close': close, column: values, 'Volume': volume}, index=stock_data.index)
+
+        # Calculate indicators
+        work = AdvancedFinancialIndicator.compute_macd(work, short_window, long_window, _STRATEGY_SIGNAL_WINDOW,
+                                                       use_talib)
+        work = AdvancedFinancialIndicator.compute_bollinger_bands(work, volume_window, _STRATEGY_NUM_STD, column=column)
+        work = AdvancedFinancialIndicator.compute_rsi(work, _STRATEGY_RSI_WINDOW, column=column)
+
+        macd = work['MACD'].to_numpy(dtype=np.float64, na_value=np.nan)
+        sig = work['Signal_Line'].to_numpy(dtype=np.float64, na_value=np.nan)
+        bb_lo = work['Bollinger_Lower'].to_numpy(dtype=np.float64, na_value=np.nan)
+        bb_up = work['Bollinger_Upper'].to_numpy(dtype=np.float64, na_value=np.nan)
+        rsi = work['RSI'].to_numpy(dtype=np.float64, na_value=np.nan)
+        vol_ma = _rolling_mean(volume.astype(np.float64, copy=False), volume_window)
+
+        # Define signals based on combined indicators, in one fused pass each when numexpr is available
+        if numexpr is not None:
+            operands = {'macd': macd, 'sig': sig, 'close': close, 'bb_lo': bb_lo, 'bb_up': bb_up,
+                        'rsi': rsi, 'vol': volume, 'vol_ma': vol_ma}
+            buy = numexpr.evaluate('(macd > sig) & (close > bb_lo) & (rsi < 70) & (vol > vol_ma)', local_dict=operands)
+            sell = numexpr.evaluate('(macd < sig) & (close < bb_up) & (rsi > 30)', local_dict=operands)
+        else:
+            buy = (macd > sig) & (close > bb_lo) & (rsi < 70) & (volume > vol_ma)
+            sell = (macd < sig) & (close < bb_up) & (rsi > 30)
+        work['Buy_Signal'] = buy
+        work['Sell_Signal'] = sell
+
+        return {name: work[name].to_numpy() for name in _STRATEGY_COLUMNS}
+
+    @staticmethod
+    def _strategy_result_dtypes(results: Dict[str, np.ndarray], use_float32: bool) -> Dict[str, np.ndarray]:
+        """Store the float indicator columns as float32 when requested, leaving the boolean signals alone."""
+        if not use_float32:
+            return results
+        return {name: result.astype(np.float32, copy=False) if result.dtype.kind == 'f' else result
+                for name, result in results.items()}
+
+    @staticmethod
+    def clear_strategy_cache() -> None:
+        """Drop all indicator results memoized by `apply_strategy`."""
+        with _STRATEGY_CACHE_LOCK:
+            _STRATEGY_CACHE.clear()
 
 # Example usage:
 # aapl_data = pd.read_csv('path_to_your_data.csv')
@@ -1,17 +1,57 @@
+from functools import reduce
+from typing import Hashable, List
+
+import numpy as np
 import pandas as pd
 
 
+def _column_labels(series_list: list[pd.Series]) -> List[Hashable]:
+    """Column labels as `pd.concat(series_list, axis=1)` would assign them."""
+    labels: List[Hashable] = []
+    unnamed = 0
+    for series in series_list:
+        if series.name is None:
+            labels.append(unnamed)
+            unnamed += 1
+        else:
+            labels.append(series.name)
+    return labels
+
+
 def calculate_correlation(series_list: list[pd.Series]) -> pd.DataFrame:
     """
     Calculate the correlation between all pairs of pandas Series in the given list.
 
+    The Series are aligned on the union of their indexes and stacked column-wise into one float64
+    matrix. Without missing or infinite values the correlation matrix comes from a single matrix product
+    over the centred values; otherwise pandas' pairwise `.corr()` handles them.
+
     :param series_list: list of pandas Series.
     :return: DataFrame, containing correlation coefficients between all pairs of Series.
     """
-    # Construct a DataFrame with the given series
-    df = pd.concat(series_list, axis=1)
+    if not series_list:
+        raise ValueError("No objects to concatenate")
+
+    index = series_list[0].index
+    if all(s.index.equals(index) for s in series_list[1:]):
+        columns = [s.to_numpy(dtype=np.float64, na_value=np.nan) for s in series_list]
+    else:
+        index = reduce(lambda left, right: left.union(right), (s.index for s in series_list[1:]), index)
+        columns = [s.reindex(index).to_numpy(dtype=np.float64, na_value=np.nan) for s in series_list]
+    values = np.column_stack(columns)
+    labels = _column_labels(series_list)
 
-    # Use the built-in .corr() method to calculate pairwise correlations
-    correlation_df = df.corr()
+    if values.shape[0] < 2 or not np.isfinite(values).all():
+        return pd.DataFrame(values, columns=labels).corr()
 
-    return correlation_df
+    centered = values - values.mean(axis=0)
+    cov = centered.T @ centered
+    variance = np.diag(cov)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = cov / np.sqrt(np.outer(variance, variance))
+    np.clip(corr, -1.0, 1.0, out=corr)
+    # A constant column has no variance; rounding in the centring can leave a tiny one, so test the range
+    constant = np.ptp(values, axis=0) == 0
+    corr[constant, :] = np.nan
+    corr[:, constant] = np.nan
+    return pd.DataFrame(corr, index=labels, columns=labels)
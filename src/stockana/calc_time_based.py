@@ -2,6 +2,7 @@
 This module define the single responsibility to do numeric calculating related with time based computing.
 """
 
+import numpy as np
 import pandas as pd
 
 
@@ -13,7 +14,23 @@ def calculate_moving_average(data_series: pd.Series, window_size: int) -> pd.Ser
     :param window_size: integer, size of the rolling window
     :return: pandas Series of moving averages
     """
-    return data_series.rolling(window=window_size).mean()
+    if not isinstance(window_size, (int, np.integer)) or window_size < 1 \
+            or not pd.api.types.is_numeric_dtype(data_series.dtype):
+        return data_series.rolling(window=window_size).mean()
+    values = data_series.to_numpy(dtype=np.float64, na_value=np.nan)
+    if not np.isfinite(values).all():
+        # A missing or infinite value would poison every later window sum, keep the pandas path for those
+        return data_series.rolling(window=window_size).mean()
+
+    averages = np.full(values.shape[0], np.nan)
+    if window_size <= values.shape[0]:
+        # Window sums as differences of one cumulative sum, taken relative to the first value to limit rounding
+        base = values[0]
+        sums = np.empty(values.shape[0] + 1)
+        sums[0] = 0.0
+        np.cumsum(values - base, out=sums[1:])
+        averages[window_size - 1:] = base + (sums[window_size:] - sums[:-window_size]) / window_size
+    return pd.Series(averages, index=data_series.index, name=data_series.name)
 
 
 def calculate_daily_return(data_series: pd.Series) -> pd.Series:
@@ -23,4 +40,21 @@ def calculate_daily_return(data_series: pd.Series) -> pd.Series:
     :param data_series: pandas Series of data points (e.g., closing prices)
     :return: pandas Series of daily return rates
     """
-    return data_series.pct_change().fillna(0)
+    values = data_series.to_numpy(dtype=np.float64, na_value=np.nan)
+    if np.isnan(values).any():
+        # pct_change forward-fills missing prices before dividing, keep the pandas path for those
+        return data_series.pct_change().fillna(0)
+
+    returns = np.zeros_like(values)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(values[1:], values[:-1], out=returns[1:])
+    returns[1:] -= 1.0
+    returns[np.isnan(returns)] = 0.0
+    # Keep the dtype pct_change would give: float inputs keep theirs, nullable integers become Float64
+    if pd.api.types.is_float_dtype(data_series.dtype):
+        dtype = data_series.dtype
+    elif pd.api.types.is_extension_array_dtype(data_series.dtype):
+        dtype = pd.Float64Dtype()
+    else:
+        dtype = np.dtype(np.float64)
+    return pd.Series(returns, index=data_series.index, name=data_series.name).astype(dtype, copy=False)
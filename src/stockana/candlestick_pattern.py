@@ -1,5 +1,18 @@
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Mapping, Optional, Tuple
+
+import numpy as np
 import pandas as pd
 
+from ._njit import HAS_NUMBA, njit, prange, set_num_threads
+
+try:
+    import talib  # type: ignore[import-not-found, import-untyped]
+except ImportError:  # TA-Lib's candlestick recognizers are only used on request
+    talib = None
+
 
 class PatternDefinitions:
     def __init__(self, doji_threshold=0.1, hammer_upper_shadow_multiplier=1):
@@ -9,12 +22,39 @@ class PatternDefinitions:
     @staticmethod
     def _valid_candle(day):
         """Check if the candle data is valid."""
-        return all(key in day for key in ['Open', 'Close', 'High', 'Low'])
+        return 'Open' in day and 'Close' in day and 'High' in day and 'Low' in day
 
     @staticmethod
     def _valid_candle_with_volume(day):
         """Check if the candle data is valid and includes volume."""
-        return all(key in day for key in ['Open', 'Close', 'High', 'Low', 'Volume'])
+        return PatternDefinitions._valid_candle(day) and 'Volume' in day
+
+    @staticmethod
+    def _opens_and_closes(days):
+        """
+        Open and close arrays of a candle window given as a DataFrame or a sequence of mappings.
+
+        :return: Tuple of (opens, closes) float64 arrays, or None if the candles lack Open or Close.
+        """
+        if isinstance(days, pd.DataFrame):
+            if 'Open' not in days or 'Close' not in days:
+                return None
+            return days['Open'].to_numpy(dtype=np.float64), days['Close'].to_numpy(dtype=np.float64)
+        if not all('Open' in day and 'Close' in day for day in days):
+            return None
+        return (np.array([day['Open'] for day in days], dtype=np.float64),
+                np.array([day['Close'] for day in days], dtype=np.float64))
+
+    @staticmethod
+    def _candle_geometry(day):
+        """
+        Body size, total range, upper shadow and lower shadow of a candle, reading each price once.
+
+        The single-candle predicates share these measurements instead of each re-deriving them from `day`.
+        """
+        open_price, close_price, high_price, low_price = day['Open'], day['Close'], day['High'], day['Low']
+        return (abs(close_price - open_price), high_price - low_price,
+                high_price - max(open_price, close_price), min(open_price, close_price) - low_price)
 
     @staticmethod
     def is_volume_increasing(day, prev_day):
@@ -43,13 +83,11 @@ class PatternDefinitions:
         if not PatternDefinitions._valid_candle(day):
             return False
 
-        body_size = abs(day['Close'] - day['Open'])
-        upper_shadow = day['High'] - max(day['Close'], day['Open'])
-        lower_shadow = min(day['Close'], day['Open']) - day['Low']
+        body_size, total_range, upper_shadow, lower_shadow = PatternDefinitions._candle_geometry(day)
         shadow_difference = abs(upper_shadow - lower_shadow)
 
-        body_is_small = body_size <= (day['High'] - day['Low']) * doji_threshold
-        shadows_are_approx_equal = shadow_difference <= (day['High'] - day['Low']) * shadow_threshold
+        body_is_small = body_size <= total_range * doji_threshold
+        shadows_are_approx_equal = shadow_difference <= total_range * shadow_threshold
 
         return body_is_small and shadows_are_approx_equal
 
@@ -58,14 +96,12 @@ class PatternDefinitions:
     def is_long_legged(day, doji_threshold=0.1, shadow_threshold=0.1):
         if not PatternDefinitions._valid_candle(day):
             return False
-        body_size = abs(day['Open'] - day['Close'])
-        upper_shadow = day['High'] - max(day['Open'], day['Close'])
-        lower_shadow = min(day['Open'], day['Close']) - day['Low']
+        body_size, total_range, upper_shadow, lower_shadow = PatternDefinitions._candle_geometry(day)
         shadow_difference = abs(upper_shadow - lower_shadow)
 
-        body_is_small = body_size <= (day['High'] - day['Low']) * doji_threshold
+        body_is_small = body_size <= total_range * doji_threshold
         shadows_are_long = upper_shadow > body_size and lower_shadow > body_size
-        shadows_are_approx_equal = shadow_difference <= (day['High'] - day['Low']) * shadow_threshold
+        shadows_are_approx_equal = shadow_difference <= total_range * shadow_threshold
 
         return body_is_small and shadows_are_long and shadows_are_approx_equal
 
@@ -74,11 +110,9 @@ class PatternDefinitions:
     def is_gravestone(day, doji_threshold=0.1, shadow_threshold=0.1):
         if not PatternDefinitions._valid_candle(day):
             return False
-        body_size = abs(day['Open'] - day['Close'])
-        upper_shadow = day['High'] - max(day['Open'], day['Close'])
-        lower_shadow = min(day['Open'], day['Close']) - day['Low']
+        body_size, total_range, upper_shadow, lower_shadow = PatternDefinitions._candle_geometry(day)
 
-        body_is_small = body_size <= (day['High'] - day['Low']) * doji_threshold
+        body_is_small = body_size <= total_range * doji_threshold
         upper_shadow_is_long = upper_shadow > body_size
         lower_shadow_is_small = lower_shadow <= body_size * shadow_threshold
 
@@ -89,11 +123,9 @@ class PatternDefinitions:
     def is_dragonfly(day, doji_threshold=0.1, shadow_threshold=0.1):
         if not PatternDefinitions._valid_candle(day):
             return False
-        body_size = abs(day['Open'] - day['Close'])
-        upper_shadow = day['High'] - max(day['Open'], day['Close'])
-        lower_shadow = min(day['Open'], day['Close']) - day['Low']
+        body_size, total_range, upper_shadow, lower_shadow = PatternDefinitions._candle_geometry(day)
 
-        body_is_small = body_size <= (day['High'] - day['Low']) * doji_threshold
+        body_is_small = body_size <= total_range * doji_threshold
         lower_shadow_is_long = lower_shadow > body_size
         upper_shadow_is_small = upper_shadow <= body_size * shadow_threshold
 
@@ -111,9 +143,7 @@ class PatternDefinitions:
         """
         if not PatternDefinitions._valid_candle(day) or not is_downtrend:
             return False
-        body = abs(day['Close'] - day['Open'])
-        lower_shadow = min(day['Open'], day['Close']) - day['Low']
-        upper_shadow = day['High'] - max(day['Open'], day['Close'])
+        body, _, upper_shadow, lower_shadow = PatternDefinitions._candle_geometry(day)
 
         return lower_shadow >= 2 * body and upper_shadow <= body * hammer_upper_shadow_multiplier
 
@@ -128,10 +158,7 @@ class PatternDefinitions:
         """
         if not PatternDefinitions._valid_candle(day):
             return False
-        body = abs(day['Close'] - day['Open'])
-        upper_shadow = day['High'] - max(day['Open'], day['Close'])
-        lower_shadow = min(day['Open'], day['Close']) - day['Low']
-        total_length = day['High'] - day['Low']
+        body, total_length, upper_shadow, lower_shadow = PatternDefinitions._candle_geometry(day)
 
         # Check if the upper shadow is at least twice the body
         # and if the body is relatively small compared to the total length
@@ -208,11 +235,12 @@ class PatternDefinitions:
         """
         if len(days) != 3:
             return False
-        if not all(all(key in day for key in ['Open', 'Close']) for day in days):
+        prices = PatternDefinitions._opens_and_closes(days)
+        if prices is None:
             return False
 
-        return all(PatternDefinitions.is_bullish(day['Open'], day['Close']) for day in days) and \
-            days[0]['Close'] < days[1]['Open'] < days[1]['Close'] < days[2]['Open']
+        opens, closes = prices
+        return bool((closes > opens).all() and closes[0] < opens[1] < closes[1] < opens[2])
 
     @staticmethod
     def is_hanging_man(day, prev_day, is_uptrend):
@@ -242,9 +270,8 @@ class PatternDefinitions:
         """
         if not all(key in day and key in prev_day for key in ['Open', 'Close', 'High', 'Low']) or not is_uptrend:
             return False
-        body = abs(day['Close'] - day['Open'])
-        upper_shadow = day['High'] - max(day['Open'], day['Close'])
-        return upper_shadow >= 2 * body and body < (day['High'] - day['Low']) / 2
+        body, total_range, upper_shadow, _ = PatternDefinitions._candle_geometry(day)
+        return upper_shadow >= 2 * body and body < total_range / 2
 
     @staticmethod
     def is_bearish_engulfing(day, prev_day):
@@ -303,11 +330,12 @@ class PatternDefinitions:
         """
         if len(days) != 3:
             return False
-        if not all(all(key in day for key in ['Open', 'Close']) for day in days):
+        prices = PatternDefinitions._opens_and_closes(days)
+        if prices is None:
             return False
 
-        return all(PatternDefinitions.is_bearish(day['Open'], day['Close']) for day in days) and \
-            days[0]['Open'] > days[1]['Open'] > days[2]['Open']
+        opens, closes = prices
+        return bool((closes < opens).all() and opens[0] > opens[1] > opens[2])
 
     @staticmethod
     def is_dark_cloud_cover(day, prev_day):
@@ -379,9 +407,366 @@ class PatternDefinitions:
         return is_shooting_star and PatternDefinitions.is_volume_increasing(day, prev_day)
 
 
+class OHLCArrays:
+    """
+    Structure-of-arrays view of a candle history: one contiguous float array per field.
+
+    Predicates over whole histories index these arrays instead of looking up keys on a row per candle.
+    `volume` is None when the source has no Volume column. Prices are float64 unless `dtype` says otherwise.
+    """
+    __slots__ = ('open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, open_, high, low, close, volume=None, dtype=np.float64):
+        self.open = np.ascontiguousarray(open_, dtype=dtype)
+        self.high = np.ascontiguousarray(high, dtype=dtype)
+        self.low = np.ascontiguousarray(low, dtype=dtype)
+        self.close = np.ascontiguousarray(close, dtype=dtype)
+        self.volume = None if volume is None else np.ascontiguousarray(volume, dtype=np.float64)
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame, dtype=np.float64) -> 'OHLCArrays':
+        """
+        Extract the arrays from a DataFrame.
+
+        The columns are checked once here, so code working on the arrays needs no per-candle key checks.
+
+        :param data: DataFrame with Open, High, Low, Close and optionally Volume columns.
+        :param dtype: Float dtype for the price arrays.
+        :raises ValueError: If any of the Open, High, Low or Close columns is missing.
+        """
+        missing = [key for key in ['Open', 'High', 'Low', 'Close'] if key not in data]
+        if missing:
+            raise ValueError(f"Candle data is missing columns: {', '.join(missing)}")
+        return cls(data['Open'].to_numpy(), data['High'].to_numpy(), data['Low'].to_numpy(),
+                   data['Close'].to_numpy(), data['Volume'].to_numpy() if 'Volume' in data else None, dtype)
+
+    def __len__(self):
+        return self.close.shape[0]
+
+
+# Patterns reported by `PatternRecognizer.recognize_patterns`, highest priority first
+PATTERN_NAMES = (
+    'Bullish Engulfing', 'Bearish Engulfing', 'Morning Star', 'Evening Star', 'Hammer', 'Inverse Hammer',
+    'Hanging Man', 'Shooting Star', 'Three White Soldiers', 'Three Black Crows', 'Dark Cloud Cover',
+    'Bullish Engulfing with Volume', 'Bearish Engulfing with Volume', 'Doji with Volume', 'Hammer with Volume',
+    'Shooting Star with Volume',
+)
+
+# Body and shadow-difference limit of a doji, as a fraction of the candle's range (`is_doji`'s defaults)
+_DOJI_THRESHOLD = 0.1
+
+# Number of closes before a candle that decide whether it sits in an up- or downtrend
+_TREND_LOOKBACK = 5
+
+# Pattern code -> label lookup for `_recognize_kernel`'s output, code 0 meaning no pattern
+_CODE_TO_NAME = np.array((None,) + PATTERN_NAMES, dtype=object)
+
+
+def _trend_mask(close: np.ndarray, lookback_period: int, increasing: bool, min_fraction: float = 1.0) -> np.ndarray:
+    """
+    Vectorized `PatternRecognizer.is_uptrend` / `is_downtrend` for every row.
+
+    Row `i` is in a trend when at least `min_fraction` of the `lookback_period - 1` steps between the
+    `lookback_period` closes before it go the trend's way; with the default of 1.0 those closes are
+    monotonic. The steps in each window are counted with a cumulative sum.
+    """
+    n = close.shape[0]
+    trend = np.zeros(n, dtype=bool)
+    if n <= lookback_period:
+        return trend
+    steps = close[1:] >= close[:-1] if increasing else close[1:] <= close[:-1]
+    counts = np.concatenate(([0], np.cumsum(steps)))
+    index = np.arange(lookback_period, n)
+    # Rounded first so that e.g. 0.6 * 5 does not become 3.0000000000000004 and demand a fourth step
+    required = int(np.ceil(round(min_fraction * (lookback_period - 1), 9)))
+    trend[lookback_period:] = counts[index - 1] - counts[index - lookback_period] >= required
+    return trend
+
+
+def _is_monotonic(values: np.ndarray, increasing: bool) -> bool:
+    """`Series.is_monotonic_increasing` / `is_monotonic_decreasing` over a float64 array, without building a Series."""
+    steps = values[1:] >= values[:-1] if increasing else values[1:] <= values[:-1]
+    # Comparisons with NaN are False, which covers every window but a lone NaN
+    return bool(steps.all()) and not (values.shape[0] == 1 and np.isnan(values[0]))
+
+
+def _pattern_masks(arrays: OHLCArrays, downtrend: np.ndarray, uptrend: np.ndarray):
+    """
+    Evaluate every pattern checked by `PatternRecognizer.recognize_patterns` as a boolean mask over all rows.
+
+    Each mask is the whole-array form of the matching `PatternDefinitions` predicate. The first, previous and
+    current day of every three-day window are offset views (`[:-2]`, `[1:-1]`, `[2:]`) of the same arrays, so
+    no window is copied. The first two rows have no full window and never match. Without volume data the
+    volume-confirmed patterns never match.
+
+    :param arrays: Candle history with at least three rows.
+    :return: List of (pattern name, mask) pairs in the recognizer's priority order.
+    """
+    first_open, prev_open, open_ = arrays.open[:-2], arrays.open[1:-1], arrays.open[2:]
+    first_high, prev_high, high = arrays.high[:-2], arrays.high[1:-1], arrays.high[2:]
+    first_low, prev_low, low = arrays.low[:-2], arrays.low[1:-1], arrays.low[2:]
+    first_close, prev_close, close = arrays.close[:-2], arrays.close[1:-1], arrays.close[2:]
+    downtrend, uptrend = downtrend[2:], uptrend[2:]
+
+    move = close - open_
+    prev_move = prev_close - prev_open
+    bullish = move > 0
+    bearish = move < 0
+    prev_bullish = prev_move > 0
+    prev_bearish = prev_move < 0
+
+    body = np.abs(move)
+    total_range = high - low
+    upper_shadow = high - np.maximum(close, open_)
+    lower_shadow = np.minimum(close, open_) - low
+
+    doji_limit = total_range * _DOJI_THRESHOLD
+    doji = (body <= doji_limit) & (np.abs(upper_shadow - lower_shadow) <= doji_limit)
+    hammer_shape = lower_shadow >= 2 * body
+    hammer = downtrend & hammer_shape & (upper_shadow <= body * 1)
+    shooting_star = uptrend & (upper_shadow >= 2 * body) & (body < total_range / 2)
+
+    bullish_engulfing = bullish & prev_bearish & (open_ < prev_close) & (close > prev_open)
+    bearish_engulfing = bearish & prev_bullish & (open_ > prev_close) & (close < prev_open)
+
+    # Middle candle of the morning and evening stars: a doji or a body small against the first candle's range
+    prev_body = np.abs(prev_move)
+    prev_doji_limit = (prev_high - prev_low) * _DOJI_THRESHOLD
+    prev_doji = (prev_body <= prev_doji_limit) & (
+        np.abs((prev_high - np.maximum(prev_close, prev_open)) - (np.minimum(prev_close, prev_open) - prev_low))
+        <= prev_doji_limit)
+    prev_small = prev_doji | (prev_body <= (first_high - first_low) * _DOJI_THRESHOLD)
+    first_midpoint = (first_open + first_close) / 2
+
+    morning_star = (first_close < first_open) & prev_small & bullish & (close >= first_midpoint)
+    evening_star = ((first_close > first_open) & prev_small & bearish & (prev_low > first_high) &
+                    (prev_high < open_) & (close < first_midpoint))
+
+    inverse_hammer = (upper_shadow >= 2 * body) & (body < total_range / 3) & (lower_shadow < body)
+    hanging_man = uptrend & hammer_shape & (upper_shadow <= body * 3) & (open_ < prev_close)
+
+    three_white_soldiers = ((first_close > first_open) & prev_bullish & bullish &
+                            (first_close < prev_open) & (prev_open < prev_close) & (prev_close < open_))
+    three_black_crows = (first_close < first_open) & prev_bearish & bearish & (first_open > prev_open) & (prev_open > open_)
+    dark_cloud_cover = prev_bullish & bearish & (open_ > prev_close) & (close < (prev_open + prev_close) / 2)
+
+    if arrays.volume is None:
+        volume_increasing = np.zeros(close.shape[0], dtype=bool)
+    else:
+        volume_increasing = arrays.volume[2:] > arrays.volume[1:-1]
+
+    # Prepend two False rows so each mask lines up with the input again (row i ends the window [i-2, i])
+    no_window = np.zeros(2, dtype=bool)
+    return list(zip(PATTERN_NAMES, (np.concatenate((no_window, mask)) for mask in [
+        bullish_engulfing,
+        bearish_engulfing,
+        morning_star,
+        evening_star,
+        hammer,
+        inverse_hammer,
+        hanging_man,
+        shooting_star,
+        three_white_soldiers,
+        three_black_crows,
+        dark_cloud_cover,
+        bullish_engulfing & volume_increasing,
+        bearish_engulfing & volume_increasing,
+        doji & volume_increasing,
+        hammer & volume_increasing,
+        shooting_star & volume_increasing,
+    ])))
+
+
+@njit(cache=True, parallel=True)
+def _recognize_kernel(open_, high, low, close, volume, has_volume, lookback_period):
+    """
+    Compiled row loop equivalent to taking the first matching mask from `_pattern_masks` per row.
+
+    Rows are independent, so they are spread over threads; each row stops at its first matching pattern.
+
+    :return: int8 array holding, per row, 1 + the index of the matched name in `PATTERN_NAMES`, or 0.
+    """
+    n = close.shape[0]
+    codes = np.zeros(n, dtype=np.int8)
+    for i in prange(2, n):
+        o, h, lo, c = open_[i], high[i], low[i], close[i]
+        po, ph, pl, pc = open_[i - 1], high[i - 1], low[i - 1], close[i - 1]
+        fo, fh, fl, fc = open_[i - 2], high[i - 2], low[i - 2], close[i - 2]
+
+        # Direction and body come from one difference per candle; max/min below lower to branchless selects
+        move, prev_move = c - o, pc - po
+        bullish, bearish = move > 0.0, move < 0.0
+        prev_bullish, prev_bearish = prev_move > 0.0, prev_move < 0.0
+        body = abs(move)
+        total_range = h - lo
+        upper_shadow = h - max(c, o)
+        lower_shadow = min(c, o) - lo
+        long_lower_shadow = lower_shadow >= 2 * body
+        long_upper_shadow = upper_shadow >= 2 * body
+        bullish_engulfing = bullish and prev_bearish and o < pc and c > po
+        bearish_engulfing = bearish and prev_bullish and o > pc and c < po
+
+        # Only the hammer-like and shooting star shapes need a trend, so skip the lookback scan otherwise
+        downtrend = uptrend = False
+        if (long_lower_shadow or long_upper_shadow) and i >= lookback_period:
+            downtrend = uptrend = True
+            for k in range(i - lookback_period, i - 1):
+                if not close[k + 1] <= close[k]:
+                    downtrend = False
+                if not close[k + 1] >= close[k]:
+                    uptrend = False
+                if not downtrend and not uptrend:
+                    break
+        hammer = downtrend and long_lower_shadow and upper_shadow <= body * 1
+        shooting_star = uptrend and long_upper_shadow and body < total_range / 2
+
+        # The middle candle of a star only matters once the first and third candles point opposite ways
+        morning_star = evening_star = False
+        if (bullish and fc < fo) or (bearish and fc > fo):
+            prev_doji_limit = (ph - pl) * _DOJI_THRESHOLD
+            prev_body = abs(prev_move)
+            prev_doji = (prev_body <= prev_doji_limit and
+                         abs((ph - max(pc, po)) - (min(pc, po) - pl)) <= prev_doji_limit)
+            prev_small = prev_doji or prev_body <= (fh - fl) * _DOJI_THRESHOLD
+            first_midpoint = (fo + fc) / 2
+            morning_star = bullish and prev_small and c >= first_midpoint
+            evening_star = bearish and prev_small and pl > fh and ph < o and c < first_midpoint
+
+        if bullish_engulfing:
+            codes[i] = 1
+        elif bearish_engulfing:
+            codes[i] = 2
+        elif morning_star:
+            codes[i] = 3
+        elif evening_star:
+            codes[i] = 4
+        elif hammer:
+            codes[i] = 5
+        elif long_upper_shadow and body < total_range / 3 and lower_shadow < body:
+            codes[i] = 6
+        elif uptrend and long_lower_shadow and upper_shadow <= body * 3 and o < pc:
+            codes[i] = 7
+        elif shooting_star:
+            codes[i] = 8
+        elif fc > fo and prev_bullish and bullish and fc < po and po < pc and pc < o:
+            codes[i] = 9
+        elif fc < fo and prev_bearish and bearish and fo > po and po > o:
+            codes[i] = 10
+        elif prev_bullish and bearish and o > pc and c < (po + pc) / 2:
+            codes[i] = 11
+        elif has_volume and volume[i] > volume[i - 1]:
+            doji_limit = total_range * _DOJI_THRESHOLD
+            if bullish_engulfing:
+                codes[i] = 12
+            elif bearish_engulfing:
+                codes[i] = 13
+            elif body <= doji_limit and abs(upper_shadow - lower_shadow) <= doji_limit:
+                codes[i] = 14
+            elif hammer:
+                codes[i] = 15
+            elif shooting_star:
+                codes[i] = 16
+    return codes
+
+
+def _talib_pattern_masks(arrays: OHLCArrays):
+    """
+    TA-Lib counterpart of `_pattern_masks`, built from TA-Lib's own candlestick recognizers.
+
+    TA-Lib defines the patterns relative to the average body and shadow sizes of the preceding candles and
+    applies no trend filter, so its matches differ from the definitions in `PatternDefinitions`. The volume
+    variants combine TA-Lib's match with a volume increase over the previous candle.
+    """
+    n = len(arrays)
+    prices = [np.asarray(values, dtype=np.float64) for values in (arrays.open, arrays.high, arrays.low, arrays.close)]
+    engulfing = talib.CDLENGULFING(*prices)
+    doji = talib.CDLDOJI(*prices) != 0
+    hammer = talib.CDLHAMMER(*prices) != 0
+    shooting_star = talib.CDLSHOOTINGSTAR(*prices) != 0
+
+    volume_up = np.zeros(n, dtype=bool)
+    if arrays.volume is not None:
+        volume_up[1:] = arrays.volume[1:] > arrays.volume[:-1]
+
+    masks = [
+        engulfing > 0,
+        engulfing < 0,
+        talib.CDLMORNINGSTAR(*prices) != 0,
+        talib.CDLEVENINGSTAR(*prices) != 0,
+        hammer,
+        talib.CDLINVERTEDHAMMER(*prices) != 0,
+        talib.CDLHANGINGMAN(*prices) != 0,
+        shooting_star,
+        talib.CDL3WHITESOLDIERS(*prices) != 0,
+        talib.CDL3BLACKCROWS(*prices) != 0,
+        talib.CDLDARKCLOUDCOVER(*prices) != 0,
+        (engulfing > 0) & volume_up,
+        (engulfing < 0) & volume_up,
+        doji & volume_up,
+        hammer & volume_up,
+        shooting_star & volume_up,
+    ]
+    return list(zip(PATTERN_NAMES, masks))
+
+
+def _first_match(masks, n: int) -> np.ndarray:
+    """Object array with the first pattern name of `masks` (in priority order) set per row, or None."""
+    # One bit per pattern in priority order; the lowest set bit is the first match
+    bits = np.zeros(n, dtype=np.uint32)
+    for bit, (_, mask) in enumerate(masks):
+        bits |= mask.astype(np.uint32) << np.uint32(bit)
+    lowest = bits & (~bits + np.uint32(1))
+    codes = np.zeros(n, dtype=np.int8)
+    matched = lowest != 0
+    codes[matched] = np.log2(lowest[matched]).astype(np.int8) + 1
+    return _CODE_TO_NAME[codes]
+
+
+def _label_patterns(arrays: OHLCArrays, use_talib: bool = False) -> np.ndarray:
+    """Object array with the first matching pattern name per row of `arrays`, or None."""
+    n = len(arrays)
+    if n < 3:
+        return np.full(n, None, dtype=object)
+
+    if use_talib:
+        if talib is None:
+            raise ImportError("TA-Lib is required for use_talib=True")
+        return _first_match(_talib_pattern_masks(arrays), n)
+
+    if HAS_NUMBA:
+        volume = arrays.volume if arrays.volume is not None else np.empty(0)
+        codes = _recognize_kernel(arrays.open, arrays.high, arrays.low, arrays.close, volume,
+                                  arrays.volume is not None, _TREND_LOOKBACK)
+        return _CODE_TO_NAME[codes]
+
+    downtrend = _trend_mask(arrays.close, _TREND_LOOKBACK, increasing=False)
+    uptrend = _trend_mask(arrays.close, _TREND_LOOKBACK, increasing=True)
+    return _first_match(_pattern_masks(arrays, downtrend, uptrend), n)
+
+
+def _init_batch_worker() -> None:
+    """Worker initializer for `PatternRecognizer.recognize_batch`: one process per CPU, one thread each."""
+    set_num_threads(1)
+
+
+def _recognize_one(item: Tuple[str, pd.DataFrame]) -> Tuple[str, pd.DataFrame]:
+    """Worker entry point for `PatternRecognizer.recognize_batch`; `data` is the worker's own unpickled copy."""
+    name, data = item
+    return name, PatternRecognizer(data).recognize_patterns()
+
+
 class PatternRecognizer:
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, use_float32: bool = False):
+        """
+        :param data: DataFrame with stock data.
+        :param use_float32: Convert the prices to float32 before scanning them. This halves the size of the
+            scanned copy but is not faster, as float64 prices must be converted first. Candles within float32
+            rounding of a pattern threshold may then be labelled differently.
+        """
         self.data = data
+        self.use_float32 = use_float32
+        self._window: Optional[deque] = None
+        self._seen = 0
 
     def is_downtrend(self, index: int, lookback_period=5) -> bool:
         """
@@ -396,8 +781,8 @@ class PatternRecognizer:
             # Not enough data to determine a trend
             return False
 
-        closing_prices = self.data['Close'][index - lookback_period:index]
-        return closing_prices.is_monotonic_decreasing
+        closing_prices = self.data['Close'].iloc[index - lookback_period:index].to_numpy(dtype=np.float64, na_value=np.nan)
+        return _is_monotonic(closing_prices, increasing=False)
 
     def is_uptrend(self, index: int, lookback_period=5) -> bool:
         """
@@ -410,49 +795,125 @@ class PatternRecognizer:
         if index < lookback_period:
             return False
 
-        closing_prices = self.data['Close'][index - lookback_period:index]
-        return closing_prices.is_monotonic_increasing
-
-    def recognize_patterns(self):
-        self.data['Pattern'] = None
-        for i in range(2, len(self.data)):
-            day = self.data.iloc[i]
-            prev_day = self.data.iloc[i - 1]
-            days = self.data.iloc[i - 2:i + 1]
-
-            date_index = day.name
-
-            if PatternDefinitions.is_bullish_engulfing(day, prev_day):
-                self.data.at[date_index, 'Pattern'] = 'Bullish Engulfing'
-            elif PatternDefinitions.is_bearish_engulfing(day, prev_day):
-                self.data.at[date_index, 'Pattern'] = 'Bearish Engulfing'
-            elif PatternDefinitions.is_morning_star(days):
-                self.data.at[date_index, 'Pattern'] = 'Morning Star'
-            elif PatternDefinitions.is_evening_star(days):
-                self.data.at[date_index, 'Pattern'] = 'Evening Star'
-            elif PatternDefinitions.is_hammer(day, is_downtrend=self.is_downtrend(i)):
-                self.data.at[date_index, 'Pattern'] = 'Hammer'
-            elif PatternDefinitions.is_inverse_hammer(day):
-                self.data.at[date_index, 'Pattern'] = 'Inverse Hammer'
-            elif PatternDefinitions.is_hanging_man(day, prev_day, is_uptrend=self.is_uptrend(i)):
-                self.data.at[date_index, 'Pattern'] = 'Hanging Man'
-            elif PatternDefinitions.is_shooting_star(day, prev_day, is_uptrend=self.is_uptrend(i)):
-                self.data.at[date_index, 'Pattern'] = 'Shooting Star'
-            elif PatternDefinitions.is_three_white_soldiers(days):
-                self.data.at[date_index, 'Pattern'] = 'Three White Soldiers'
-            elif PatternDefinitions.is_three_black_crows(days):
-                self.data.at[date_index, 'Pattern'] = 'Three Black Crows'
-            elif PatternDefinitions.is_dark_cloud_cover(day, prev_day):
-                self.data.at[date_index, 'Pattern'] = 'Dark Cloud Cover'
-            elif PatternDefinitions.is_engulfing_with_volume(day, prev_day, 'bullish'):
-                self.data.at[date_index, 'Pattern'] = 'Bullish Engulfing with Volume'
-            elif PatternDefinitions.is_engulfing_with_volume(day, prev_day, 'bearish'):
-                self.data.at[date_index, 'Pattern'] = 'Bearish Engulfing with Volume'
-            elif PatternDefinitions.is_doji_with_volume(day, prev_day, 'standard'):
-                self.data.at[date_index, 'Pattern'] = 'Doji with Volume'
-            elif PatternDefinitions.is_hammer_with_volume(day, prev_day, is_downtrend=self.is_downtrend(i)):
-                self.data.at[date_index, 'Pattern'] = 'Hammer with Volume'
-            elif PatternDefinitions.is_shooting_star_with_volume(day, prev_day, is_uptrend=self.is_uptrend(i)):
-                self.data.at[date_index, 'Pattern'] = 'Shooting Star with Volume'
+        closing_prices = self.data['Close'].iloc[index - lookback_period:index].to_numpy(dtype=np.float64, na_value=np.nan)
+        return _is_monotonic(closing_prices, increasing=True)
+
+    def trend_mask(self, increasing: bool, lookback_period: int = 5, min_fraction: float = 1.0) -> np.ndarray:
+        """
+        Evaluate `is_uptrend` / `is_downtrend` for every row at once, optionally relaxed to a majority of steps.
+
+        :param increasing: True for uptrends, False for downtrends.
+        :param lookback_period: Number of days to look back to check for a trend.
+        :param min_fraction: Fraction of the day-to-day steps within the lookback that must go the trend's
+            way. The default of 1.0 requires the closes to be monotonic, matching `is_uptrend` / `is_downtrend`.
+        :return: Boolean array with one entry per row of `data`.
+        """
+        close = self.data['Close'].to_numpy(dtype=np.float64, na_value=np.nan)
+        return _trend_mask(close, lookback_period, increasing, min_fraction)
+
+    def scan_patterns(self) -> pd.DataFrame:
+        """
+        Evaluate every pattern checked by `recognize_patterns` for every row, without resolving priorities.
+
+        All masks come from one pass over the OHLC(V) arrays that shares the candle measurements (body, range,
+        shadows, trends) between the patterns. Unlike `recognize_patterns`, a row matching several patterns
+        shows all of them.
 
+        :return: DataFrame with `data`'s index and one boolean column per name in `PATTERN_NAMES`.
+        """
+        dtype = np.float32 if self.use_float32 else np.float64
+        arrays = OHLCArrays.from_frame(self.data, dtype)
+        if len(arrays) < 3:
+            masks = [(name, np.zeros(len(arrays), dtype=bool)) for name in PATTERN_NAMES]
+        else:
+            downtrend = _trend_mask(arrays.close, _TREND_LOOKBACK, increasing=False)
+            uptrend = _trend_mask(arrays.close, _TREND_LOOKBACK, increasing=True)
+            masks = _pattern_masks(arrays, downtrend, uptrend)
+        return pd.DataFrame(dict(masks), index=self.data.index)
+
+    def recognize_patterns(self, start: int = 0, use_talib: bool = False):
+        """
+        Label each row from the third onwards with the first matching candlestick pattern.
+
+        All patterns are evaluated as whole-column boolean masks over the OHLC(V) arrays and the first match
+        per row, in the order of `PATTERN_NAMES`, is written to a 'Pattern' column. With Numba installed the
+        same checks run in one compiled pass instead. Rows without a match, and the first two rows, are left
+        as None.
+
+        :param start: First row to (re)label. Earlier rows keep their existing 'Pattern' values, so after
+            appending or correcting bars only the affected tail needs to be scanned.
+        :param use_talib: Match the patterns with TA-Lib's C recognizers (`CDLENGULFING`, `CDLHAMMER`, ...)
+            instead of the definitions in `PatternDefinitions`. TA-Lib uses its own, average-relative
+            definitions, so the labels differ; it must be installed.
+        :return: The DataFrame with the 'Pattern' column added.
+        """
+        n = len(self.data)
+        if n < 3 and start <= 0:
+            self.data['Pattern'] = None
+            return self.data
+
+        # Labelling row `start` needs the candles of its trend lookback before it
+        # TA-Lib's averages reach further back than the trend lookback, so it always sees the full history
+        offset = 0 if use_talib else max(start - _TREND_LOOKBACK, 0)
+        dtype = np.float32 if self.use_float32 else np.float64
+        labels = _label_patterns(OHLCArrays.from_frame(self.data.iloc[offset:], dtype), use_talib)
+
+        if start > 0 and 'Pattern' in self.data:
+            patterns = self.data['Pattern'].to_numpy(dtype=object, copy=True)
+        else:
+            patterns = np.full(n, None, dtype=object)
+        patterns[max(start, 0):] = labels[max(start, 0) - offset:]
+        self.data['Pattern'] = patterns
         return self.data
+
+    def update(self, candle: Mapping) -> Optional[str]:
+        """
+        Classify one new candle, appended after `data` and any earlier updates, without rescanning the history.
+
+        Only the last few candles a pattern can depend on (the trend lookback plus the new one) are kept, so
+        each update costs the same regardless of history length. `data` itself is not modified.
+
+        :param candle: Mapping with Open, High, Low, Close and optionally Volume.
+        :return: The first matching pattern name for the new candle, or None.
+        """
+        if self._window is None:
+            self._window = deque(maxlen=_TREND_LOOKBACK + 1)
+            if all(key in self.data for key in ['Open', 'High', 'Low', 'Close']):
+                keys = [key for key in ['Open', 'High', 'Low', 'Close', 'Volume'] if key in self.data]
+                self._window.extend(self.data[keys].tail(_TREND_LOOKBACK).to_dict('records'))
+                self._seen = len(self.data)
+
+        self._window.append(candle)
+        self._seen += 1
+        if self._seen < 3:
+            return None
+
+        window = list(self._window)
+        volume = [day['Volume'] for day in window] if all('Volume' in day for day in window) else None
+        arrays = OHLCArrays([day['Open'] for day in window], [day['High'] for day in window],
+                            [day['Low'] for day in window], [day['Close'] for day in window], volume,
+                            np.float32 if self.use_float32 else np.float64)
+        return _label_patterns(arrays)[-1]
+
+    @staticmethod
+    def recognize_batch(datasets: Dict[str, pd.DataFrame], workers: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Run `recognize_patterns` over several independent histories, e.g. one per ticker.
+
+        By default the histories are processed one after another in the current process; the compiled scan
+        already runs in parallel over the rows of each history. Passing `workers > 1` spreads the histories
+        over that many spawned worker processes instead, each limited to a single Numba thread. This only
+        pays off for many long histories, and callers must then guard their entry point with
+        `if __name__ == '__main__':`. The input frames are never modified; new frames are returned.
+
+        :param datasets: Mapping of name (e.g. ticker symbol) to OHLC(V) DataFrame.
+        :param workers: Number of worker processes, or None to run in the current process.
+        :return: Mapping of the same names to new DataFrames with a 'Pattern' column.
+        """
+        if workers is None or workers <= 1 or len(datasets) <= 1:
+            return {name: PatternRecognizer(data.copy()).recognize_patterns() for name, data in datasets.items()}
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(datasets)),
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_batch_worker) as executor:
+            return dict(executor.map(_recognize_one, datasets.items()))
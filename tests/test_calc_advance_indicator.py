@@ -1,6 +1,8 @@
 import pytest
+import numpy as np
 import pandas as pd
-from src.stockana.calc_advance_indicator import AdvancedFinancialIndicator
+from src.stockana import calc_advance_indicator
+from src.stockana.calc_advance_indicator import AdvancedFinancialIndicator, _ema_kernel, _strategy_kernel
 
 
 # Sample data for testing
@@ -45,6 +47,55 @@ def test_compute_ema_invalid_window(stock_data):
         AdvancedFinancialIndicator.compute_ema(stock_data, window=-1, column='Close')
 
 
+# EMA kernel must reproduce pandas' adjust=False recurrence, including NaN handling
+def test_ema_kernel_matches_pandas():
+    values = np.array([np.nan, 100, 102, np.nan, 101, 105, 107], dtype=np.float64)
+    expected = pd.Series(values).ewm(span=3, adjust=False).mean().to_numpy()
+    np.testing.assert_allclose(_ema_kernel(values, 2.0 / (3 + 1.0)), expected)
+
+
+# TA-Lib is only used on request, so installing it does not change the results
+def test_talib_is_opt_in(monkeypatch, stock_data):
+    monkeypatch.setattr(calc_advance_indicator, 'talib', object())
+    monkeypatch.setattr(calc_advance_indicator, 'HAS_NUMBA', False)
+    AdvancedFinancialIndicator.clear_strategy_cache()
+    ema = AdvancedFinancialIndicator.compute_ema(stock_data, window=2)
+    np.testing.assert_allclose(ema, stock_data['Close'].ewm(span=2, adjust=False).mean())
+    result = AdvancedFinancialIndicator.apply_strategy(stock_data.copy(), 2, 5, 3)
+    assert not result['MACD'].isna().any()
+
+    monkeypatch.setattr(calc_advance_indicator, 'talib', None)
+    with pytest.raises(ImportError):
+        AdvancedFinancialIndicator.compute_macd(stock_data, use_talib=True)
+
+
+# Nullable Float64/Int64 columns with <NA> give the same indicators as float64 columns with NaN
+def test_indicators_accept_nullable_dtypes():
+    rng = np.random.default_rng(11)
+    close = 100 + np.cumsum(rng.normal(size=60))
+    close[[5, 30]] = np.nan
+    volume = rng.integers(100, 200, size=60)
+    plain = pd.DataFrame({'Close': close, 'Volume': volume.astype(np.float64)})
+    nullable = pd.DataFrame({'Close': pd.array(close, dtype='Float64'), 'Volume': pd.array(volume, dtype='Int64')})
+    nullable.loc[10, 'Volume'] = pd.NA
+    plain.loc[10, 'Volume'] = np.nan
+
+    np.testing.assert_allclose(AdvancedFinancialIndicator.compute_ema(nullable, window=5),
+                               AdvancedFinancialIndicator.compute_ema(plain, window=5))
+    for indicator in [AdvancedFinancialIndicator.compute_macd, AdvancedFinancialIndicator.compute_bollinger_bands,
+                      AdvancedFinancialIndicator.compute_rsi]:
+        pd.testing.assert_frame_equal(indicator(nullable.copy()).drop(columns=['Close', 'Volume']),
+                                      indicator(plain.copy()).drop(columns=['Close', 'Volume']))
+
+    AdvancedFinancialIndicator.clear_strategy_cache()
+    expected = AdvancedFinancialIndicator.apply_strategy(plain.copy(), 12, 26, 20).drop(columns=['Close', 'Volume'])
+    AdvancedFinancialIndicator.clear_strategy_cache()
+    result = AdvancedFinancialIndicator.apply_strategy(nullable.copy(), 12, 26, 20).drop(columns=['Close', 'Volume'])
+    pd.testing.assert_frame_equal(result, expected)
+    batch = AdvancedFinancialIndicator.apply_strategy_batch({'AAA': nullable.copy()}, 12, 26, 20)
+    pd.testing.assert_frame_equal(batch['AAA'].drop(columns=['Close', 'Volume']), expected)
+
+
 # Testing MACD Calculation
 def test_compute_macd(stock_data):
     result = AdvancedFinancialIndicator.compute_macd(stock_data)
@@ -57,12 +108,89 @@ def test_compute_bollinger_bands(stock_data):
     assert all(key in result for key in ['Bollinger_Mid', 'Bollinger_Upper', 'Bollinger_Lower'])
 
 
+# Bollinger Bands must match pandas' rolling mean/std
+@pytest.mark.parametrize('use_bottleneck', [True, False])
+def test_compute_bollinger_bands_matches_rolling(monkeypatch, use_bottleneck):
+    if use_bottleneck:
+        pytest.importorskip('bottleneck')
+    else:
+        monkeypatch.setattr(calc_advance_indicator, 'bottleneck', None)
+    close = pd.Series([100, 102, 101, 105, 107, 106, 109, 111], dtype=float)
+    result = AdvancedFinancialIndicator.compute_bollinger_bands(pd.DataFrame({'Close': close}), window=3)
+    mid = close.rolling(3).mean()
+    std = close.rolling(3).std()
+    np.testing.assert_allclose(result['Bollinger_Mid'], mid)
+    np.testing.assert_allclose(result['Bollinger_Upper'], mid + 2 * std)
+    np.testing.assert_allclose(result['Bollinger_Lower'], mid - 2 * std)
+
+
+# With Copy-on-Write the rolling results can be read-only views, which must not be written to
+def test_compute_bollinger_bands_copy_on_write(monkeypatch):
+    monkeypatch.setattr(calc_advance_indicator, 'bottleneck', None)
+    close = pd.Series([100, 102, 101, 105, 107, 106, 109, 111], dtype=float)
+    with pd.option_context('mode.copy_on_write', True):
+        result = AdvancedFinancialIndicator.compute_bollinger_bands(pd.DataFrame({'Close': close}), window=3)
+    np.testing.assert_allclose(result['Bollinger_Lower'], close.rolling(3).mean() - 2 * close.rolling(3).std())
+
+
 # Testing RSI Calculation
 def test_compute_rsi(stock_data):
     result = AdvancedFinancialIndicator.compute_rsi(stock_data)
     assert 'RSI' in result
 
 
+# RSI uses Wilder's smoothing seeded with the simple mean of the first `window` changes
+def test_compute_rsi_wilder_smoothing(stock_data):
+    result = AdvancedFinancialIndicator.compute_rsi(stock_data, window=2)
+    expected = [np.nan, np.nan, 100 - 100 / 3, 100 - 100 / 11, 100 - 100 / 19]
+    np.testing.assert_allclose(result['RSI'], expected)
+
+
+def _wilder_rsi_reference(close, window):
+    """Wilder RSI in plain pandas over the valid price changes only."""
+    delta = close.diff().dropna()
+    averages = []
+    for changes in (delta.clip(lower=0), -delta.clip(upper=0)):
+        seeded = changes.iloc[window - 1:].copy()
+        seeded.iloc[0] = changes.iloc[:window].mean()
+        averages.append(seeded.ewm(alpha=1.0 / window, adjust=False).mean())
+    return (100 - 100 / (1 + averages[0] / averages[1])).reindex(close.index)
+
+
+# Leading and inner NaN prices leave NaN RSI values and are skipped by the Wilder averages
+@pytest.mark.parametrize('use_numba', [True, False])
+def test_compute_rsi_missing_prices(monkeypatch, use_numba):
+    if not use_numba:
+        monkeypatch.setattr(calc_advance_indicator, 'HAS_NUMBA', False)
+    rng = np.random.default_rng(5)
+    close = pd.Series(100 + np.cumsum(rng.normal(size=60)))
+    close.iloc[[0, 1, 2, 20, 35, 36]] = np.nan
+
+    result = AdvancedFinancialIndicator.compute_rsi(pd.DataFrame({'Close': close}), window=5)['RSI']
+
+    np.testing.assert_allclose(result, _wilder_rsi_reference(close, 5))
+    assert result[close.isna()].isna().all()
+    assert result.iloc[:8].isna().all() and not np.isnan(result.iloc[8])
+
+    all_missing = AdvancedFinancialIndicator.compute_rsi(pd.DataFrame({'Close': np.full(30, np.nan)}))['RSI']
+    assert all_missing.isna().all()
+
+
+# A flat price has no gains or losses, so its RSI is NaN; gains without losses give 100
+@pytest.mark.parametrize('use_numba', [True, False])
+def test_compute_rsi_flat_price(monkeypatch, use_numba):
+    if not use_numba:
+        monkeypatch.setattr(calc_advance_indicator, 'HAS_NUMBA', False)
+    close = np.array([100.0] * 5 + [101, 102, 103])
+    result = AdvancedFinancialIndicator.compute_rsi(pd.DataFrame({'Close': close}), window=2)['RSI']
+    assert result.iloc[:5].isna().all()
+    np.testing.assert_allclose(result.iloc[5:], 100.0)
+
+    volume = np.full(close.shape[0], 150.0)
+    rsi = _strategy_kernel(close, close, volume, 3, 6, 9, 3, 2.0, 2, 3)[5]
+    np.testing.assert_allclose(rsi, result)
+
+
 # Testing Fibonacci Retracement Calculation
 def test_compute_fibonacci_retracement(stock_data):
     stock_data_reset = stock_data.reset_index()  # Reset index to make 'Date' a column
@@ -71,6 +199,16 @@ def test_compute_fibonacci_retracement(stock_data):
     assert 'Level_0' in levels and 'Level_100' in levels
 
 
+# Sorted and unsorted dates select the same rows
+def test_compute_fibonacci_retracement_unsorted_dates(stock_data):
+    stock_data_reset = stock_data.reset_index()
+    expected = AdvancedFinancialIndicator.compute_fibonacci_retracement(stock_data_reset, '2021-01-02', '2021-01-04')
+    shuffled = stock_data_reset.iloc[[3, 0, 4, 2, 1]]
+    levels = AdvancedFinancialIndicator.compute_fibonacci_retracement(shuffled, '2021-01-02', '2021-01-04')
+    assert levels == expected
+    assert expected['Level_0'] == 106 and expected['Level_100'] == 100
+
+
 # Test Fibonacci Retracement with invalid date range
 def test_compute_fibonacci_retracement_invalid_date(stock_data):
     with pytest.raises(ValueError):
@@ -83,12 +221,114 @@ def test_apply_strategy(stock_data):
     assert all(key in result for key in ['Buy_Signal', 'Sell_Signal'])
 
 
+# Repeated calls reuse memoized results, changed data is recomputed
+def test_apply_strategy_cache(monkeypatch, stock_data):
+    monkeypatch.setattr(calc_advance_indicator, 'HAS_NUMBA', False)
+    AdvancedFinancialIndicator.clear_strategy_cache()
+    first = AdvancedFinancialIndicator.apply_strategy(stock_data.copy(), 2, 5, 3)
+    second = AdvancedFinancialIndicator.apply_strategy(stock_data.copy(), 2, 5, 3)
+    pd.testing.assert_frame_equal(first, second)
+
+    second.iloc[:, second.columns.get_loc('Bollinger_Mid')] = 0.0
+    third = AdvancedFinancialIndicator.apply_strategy(stock_data.copy(), 2, 5, 3)
+    pd.testing.assert_frame_equal(first, third)
+
+    changed = stock_data.copy()
+    changed['Close'] = changed['Close'] * 2
+    fourth = AdvancedFinancialIndicator.apply_strategy(changed, 2, 5, 3)
+    np.testing.assert_allclose(fourth['Bollinger_Mid'], first['Bollinger_Mid'] * 2)
+    assert len(calc_advance_indicator._STRATEGY_CACHE) == 2
+
+
+# The fused kernel path recomputes instead of hashing its inputs
+def test_apply_strategy_kernel_not_cached(monkeypatch, stock_data):
+    monkeypatch.setattr(calc_advance_indicator, 'HAS_NUMBA', True)
+    monkeypatch.setattr(calc_advance_indicator, 'talib', None)
+    AdvancedFinancialIndicator.clear_strategy_cache()
+    AdvancedFinancialIndicator.apply_strategy(stock_data, 2, 5, 3)
+    assert not calc_advance_indicator._STRATEGY_CACHE
+
+
+# float32 mode stores the indicator columns in single precision
+def test_apply_strategy_float32():
+    rng = np.random.default_rng(7)
+    data = pd.DataFrame({'Close': 100 + np.cumsum(rng.normal(size=200)), 'Volume': rng.uniform(100, 200, size=200)})
+    full = AdvancedFinancialIndicator.apply_strategy(data.copy(), 12, 26, 20)
+    single = AdvancedFinancialIndicator.apply_strategy(data.copy(), 12, 26, 20, use_float32=True)
+    for name in ['MACD', 'Signal_Line', 'Bollinger_Mid', 'Bollinger_Upper', 'Bollinger_Lower', 'RSI']:
+        assert single[name].dtype == np.float32
+        np.testing.assert_allclose(single[name], full[name], rtol=1e-4, atol=1e-4)
+    assert single['Buy_Signal'].dtype == bool
+
+
+# A batch over several histories matches applying the strategy to each one
+def test_apply_strategy_batch():
+    rng = np.random.default_rng(3)
+    datasets = {symbol: pd.DataFrame({'Close': 100 + np.cumsum(rng.normal(size=size)),
+                                      'Volume': rng.uniform(100, 200, size=size)})
+                for symbol, size in [('AAA', 80), ('BBB', 50), ('CCC', 3)]}
+    expected = {symbol: AdvancedFinancialIndicator.apply_strategy(data.copy(), 12, 26, 20)
+                for symbol, data in datasets.items()}
+
+    results = AdvancedFinancialIndicator.apply_strategy_batch(datasets, 12, 26, 20)
+
+    assert list(results) == list(datasets)
+    for symbol, data in results.items():
+        pd.testing.assert_frame_equal(data, expected[symbol])
+
+
+# The fused strategy kernel must agree with the standalone indicators
+def test_strategy_kernel_matches_indicators():
+    rng = np.random.default_rng(42)
+    close = 100 + np.cumsum(rng.normal(size=60))
+    volume = rng.uniform(100, 200, size=60)
+    macd, signal, mid, upper, lower, rsi, buy, sell = _strategy_kernel(close, close, volume, 3, 6, 9, 5, 2.0, 14, 5)
+
+    close_s = pd.Series(close)
+    expected_macd = close_s.ewm(span=3, adjust=False).mean() - close_s.ewm(span=6, adjust=False).mean()
+    expected_signal = expected_macd.ewm(span=9, adjust=False).mean()
+    expected_mid = close_s.rolling(5).mean()
+    expected_std = close_s.rolling(5).std()
+    expected_rsi = AdvancedFinancialIndicator.compute_rsi(pd.DataFrame({'Close': close}))['RSI']
+    volume_ma = pd.Series(volume).rolling(5).mean()
+
+    np.testing.assert_allclose(macd, expected_macd)
+    np.testing.assert_allclose(signal, expected_signal)
+    np.testing.assert_allclose(mid, expected_mid)
+    np.testing.assert_allclose(upper, expected_mid + 2 * expected_std)
+    np.testing.assert_allclose(lower, expected_mid - 2 * expected_std)
+    np.testing.assert_allclose(rsi, expected_rsi)
+    np.testing.assert_array_equal(buy, (expected_macd > expected_signal) & (close_s > expected_mid - 2 * expected_std) &
+                                  (expected_rsi < 70) & (pd.Series(volume) > volume_ma))
+    np.testing.assert_array_equal(sell, (expected_macd < expected_signal) & (close_s < expected_mid + 2 * expected_std) &
+                                  (expected_rsi > 30))
+
+
+# The fused kernel's RSI handles missing prices like `compute_rsi`, and no signal fires on them
+def test_strategy_kernel_rsi_missing_prices():
+    rng = np.random.default_rng(8)
+    close = 100 + np.cumsum(rng.normal(size=60))
+    close[[0, 1, 25, 40]] = np.nan
+    volume = rng.uniform(100, 200, size=60)
+    _, _, _, _, _, rsi, buy, sell = _strategy_kernel(close, close, volume, 3, 6, 9, 5, 2.0, 14, 5)
+
+    expected_rsi = AdvancedFinancialIndicator.compute_rsi(pd.DataFrame({'Close': close}))['RSI']
+    np.testing.assert_allclose(rsi, expected_rsi)
+    assert not (buy[np.isnan(rsi)] | sell[np.isnan(rsi)]).any()
+
+
 # Test MACD with valid data
 def test_compute_macd_valid(stock_data):
     result = AdvancedFinancialIndicator.compute_macd(stock_data)
     assert 'MACD' in result and 'Signal_Line' in result
 
 
+# Test MACD with invalid window size
+def test_compute_macd_invalid_window(stock_data):
+    with pytest.raises(ValueError):
+        AdvancedFinancialIndicator.compute_macd(stock_data, short_window=0)
+
+
 # Test MACD with empty data
 def test_compute_macd_empty(empty_data):
     result = AdvancedFinancialIndicator.compute_macd(empty_data)
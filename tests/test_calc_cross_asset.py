@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 import pandas as pd
 from src.stockana.calc_cross_asset import calculate_correlation  # Replace 'your_module_name' with the actual name of your module
 
@@ -21,3 +22,64 @@ def test_calculate_correlation():
     assert result.iloc[1, 2] < 0, "s2 and s3 should be inversely correlated"
 
 # Optional: Add more tests for edge cases, such as empty input, non-numeric data, etc.
+
+
+def test_calculate_correlation_matches_pandas():
+    rng = np.random.default_rng(0)
+    series_list = [pd.Series(rng.normal(size=50), name=name) for name in ['a', 'b', 'c']]
+    series_list.append(pd.Series(np.full(50, 3.0)))  # zero variance gives NaN, as in pandas
+
+    result = calculate_correlation(series_list)
+    expected = pd.concat(series_list, axis=1).corr()
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_calculate_correlation_with_missing_values():
+    s1 = pd.Series([1, 2, None, 4, 5])
+    s2 = pd.Series([5, 4, 3, 2, 1])
+
+    result = calculate_correlation([s1, s2])
+
+    assert result.iloc[0, 1] == pytest.approx(-1.0)
+
+
+def test_calculate_correlation_misaligned_index():
+    s1 = pd.Series([1.0, 2.0, 3.0, 4.0], index=[0, 1, 2, 3], name='a')
+    s2 = pd.Series([8.0, 6.0, 4.0, 2.0], index=[1, 2, 3, 4], name='b')
+
+    result = calculate_correlation([s1, s2])
+    expected = pd.concat([s1, s2], axis=1).corr()
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_calculate_correlation_nullable_dtypes():
+    s1 = pd.Series([1, 2, None, 4, 5], dtype='Float64', name='a')
+    s2 = pd.Series([5, 4, 3, pd.NA, 1], dtype='Int64', name='b')
+
+    result = calculate_correlation([s1, s2])
+    expected = pd.concat([s1.astype(float), s2.astype(float)], axis=1).corr()
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_calculate_correlation_infinite_values():
+    s1 = pd.Series([1, 2, np.inf, 4.0])
+    s2 = pd.Series([1, 2, 3, 4.0])
+
+    result = calculate_correlation([s1, s2])
+    expected = pd.concat([s1, s2], axis=1).corr()
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_calculate_correlation_constant_series():
+    series_list = [pd.Series([0.1] * 7, name='a'), pd.Series(np.arange(7.0), name='b'),
+                   pd.Series([1 / 3] * 7, name='c')]
+
+    result = calculate_correlation(series_list)
+    expected = pd.concat(series_list, axis=1).corr()
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert result.isna().sum().sum() == 8
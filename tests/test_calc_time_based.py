@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from src.stockana import calc_time_based
 
@@ -9,9 +10,36 @@ def test_calculate_moving_average():
     pd.testing.assert_series_equal(result, expected, check_dtype=False)
 
 
+def test_calculate_moving_average_matches_rolling():
+    data = pd.Series(1000 + np.cumsum(np.random.default_rng(0).normal(size=500)), name='Close')
+    for window in (1, 20, 500, 501):
+        pd.testing.assert_series_equal(calc_time_based.calculate_moving_average(data, window),
+                                       data.rolling(window=window).mean())
+
+    data[10] = np.nan
+    pd.testing.assert_series_equal(calc_time_based.calculate_moving_average(data, 5), data.rolling(window=5).mean())
+
+
+def test_calculate_moving_average_nullable():
+    data = pd.Series([1, 2, None, 4, 5, 6], dtype='Float64')
+    pd.testing.assert_series_equal(calc_time_based.calculate_moving_average(data, 2), data.rolling(window=2).mean())
+
+    data = pd.Series([1, 2, 3, 4, 5, 6], dtype='Int64')
+    pd.testing.assert_series_equal(calc_time_based.calculate_moving_average(data, 2), data.rolling(window=2).mean())
+
+
 def test_calculate_daily_return():
     data = pd.Series([100, 101, 102, 101, 100])
     result = calc_time_based.calculate_daily_return(data)
     expected = pd.Series([0, 0.01, 0.00990099, -0.00980392, -0.00990099])
     assert all((result - expected).abs() < 1e-7)  # Compare with a small tolerance due to floating point arithmetic
 
+
+def test_calculate_daily_return_keeps_dtype():
+    for dtype in ['float32', 'Float64', 'Int64', 'int64']:
+        data = pd.Series([100, 101, 102, 101, 100], dtype=dtype)
+        pd.testing.assert_series_equal(calc_time_based.calculate_daily_return(data), data.pct_change().fillna(0),
+                                       atol=1e-6)
+
+    data = pd.Series([100, 101, None, 101, 100], dtype='Float64')
+    pd.testing.assert_series_equal(calc_time_based.calculate_daily_return(data), data.pct_change().fillna(0))
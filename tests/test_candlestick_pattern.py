@@ -1,8 +1,10 @@
 import pytest
 import os
+import numpy as np
 import pandas as pd
 
-from src.stockana.candlestick_pattern import PatternDefinitions, PatternRecognizer
+from src.stockana.candlestick_pattern import (PATTERN_NAMES, PatternDefinitions, PatternRecognizer, OHLCArrays,
+                                              _pattern_masks, _recognize_kernel, _trend_mask)
 
 
 def create_day(open_price, high_price, low_price, close_price, volume=0):
@@ -10,7 +12,7 @@ def create_day(open_price, high_price, low_price, close_price, volume=0):
 
 
 class TestPatternDefinitions:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def pattern_definitions(self):
         return PatternDefinitions()
 
@@ -94,6 +96,9 @@ class TestPatternDefinitions:
         days = [day1, day2, day3]
         assert not PatternDefinitions.is_three_white_soldiers(days)
 
+        # A DataFrame window, as sliced from a price history
+        assert PatternDefinitions.is_three_white_soldiers(pd.DataFrame([day1, day2, create_day(109, 113, 107, 112)]))
+
     def test_is_hanging_man(self):
         prev_day = create_day(100, 105, 95, 102)  # Uptrend context
         day = create_day(101, 102, 96, 100)  # Potential Hanging Man pattern
@@ -139,6 +144,9 @@ class TestPatternDefinitions:
         days = [day1, day2, day3]
         assert not PatternDefinitions.is_three_black_crows(days)
 
+        # A DataFrame window, as sliced from a price history
+        assert PatternDefinitions.is_three_black_crows(pd.DataFrame([day1, day2, create_day(91, 91, 85, 86)]))
+
     def test_is_dark_cloud_cover(self):
         prev_day = create_day(100, 105, 95, 104)  # Bullish candle
         day = create_day(105, 110, 100, 101.5)  # Opens above prev close, closes below midpoint
@@ -237,6 +245,33 @@ class TestPatternDefinitions:
         pattern_recognizer = PatternRecognizer(data)
         assert pattern_recognizer.is_uptrend(4, 3) == False
 
+    def test_trend_with_missing_close(self):
+        # A missing close inside the lookback breaks the trend, in nullable columns as well
+        data = pd.DataFrame({'Close': pd.array([100, None, 104, 106, 108], dtype='Float64')})
+        pattern_recognizer = PatternRecognizer(data)
+        assert not pattern_recognizer.is_uptrend(4, 3)
+        assert pattern_recognizer.is_uptrend(5, 3)
+
+        data = pd.DataFrame({'Close': pd.array([100, 98, None, 94, 92], dtype='Float64')})
+        pattern_recognizer = PatternRecognizer(data)
+        assert not pattern_recognizer.is_downtrend(4, 3)
+
+    def test_trend_mask(self):
+        data = pd.DataFrame({'Close': [100, 102, 101, 104, 106, 108, 107]})
+        pattern_recognizer = PatternRecognizer(data)
+
+        strict = pattern_recognizer.trend_mask(increasing=True, lookback_period=3)
+        assert strict.tolist() == [pattern_recognizer.is_uptrend(i, 3) for i in range(len(data))]
+
+        relaxed = pattern_recognizer.trend_mask(increasing=True, lookback_period=5, min_fraction=0.75)
+        assert relaxed.tolist() == [False, False, False, False, False, True, True]
+
+        # Missing closes in a nullable column behave like NaN
+        nullable = PatternRecognizer(pd.DataFrame({'Close': pd.array([100, 102, None, 104, 106, 108, 110], dtype='Float64')}))
+        expected = PatternRecognizer(pd.DataFrame({'Close': [100, 102, np.nan, 104, 106, 108, 110]}))
+        assert nullable.trend_mask(increasing=True, lookback_period=3).tolist() == \
+            expected.trend_mask(increasing=True, lookback_period=3).tolist()
+
 
     def test_recognize_bullish_engulfing(self):
         data = pd.DataFrame({
@@ -353,6 +388,130 @@ class TestPatternDefinitions:
         # As the Morning Star pattern spans 3 days, check the pattern of the last day of the pattern
         assert recognized_patterns['Pattern'].iloc[-1] == 'Morning Star'
 
+    def test_recognize_three_white_soldiers(self):
+        data_three_white_soldiers = pd.DataFrame({
+            'Open': [88, 94, 100, 106, 112],
+            'High': [94, 100, 106, 112, 118],
+            'Low': [87, 93, 99, 105, 111],
+            'Close': [93, 99, 105, 111, 117],  # Each day opens above the previous close
+            'Volume': [1000, 1000, 1000, 1000, 1000]
+        })
+
+        pattern_recognizer = PatternRecognizer(data_three_white_soldiers)
+        recognized_patterns = pattern_recognizer.recognize_patterns()
+
+        assert recognized_patterns['Pattern'].iloc[-1] == 'Three White Soldiers'
+        assert recognized_patterns['Pattern'].iloc[:2].isna().all()
+
+    def test_recognize_kernel_matches_masks(self):
+        rng = np.random.default_rng(0)
+        open_ = 100 + rng.integers(-3, 4, 500).cumsum().astype(float)
+        close = open_ + rng.integers(-3, 4, 500)
+        high = np.maximum(open_, close) + rng.integers(0, 3, 500)
+        low = np.minimum(open_, close) - rng.integers(0, 3, 500)
+        volume = rng.integers(100, 110, 500).astype(float)
+        arrays = OHLCArrays(open_, high, low, close, volume)
+
+        codes = _recognize_kernel(open_, high, low, close, volume, True, 5)
+        masks = [mask for _, mask in _pattern_masks(arrays, _trend_mask(close, 5, False), _trend_mask(close, 5, True))]
+        expected = np.select(masks, np.arange(1, len(masks) + 1), default=0)
+        expected[:2] = 0
+        np.testing.assert_array_equal(codes, expected)
+
+    def test_recognize_patterns_float32(self):
+        data_hammer = pd.DataFrame({
+            'Open': [102, 101, 100, 98, 95, 92, 89],
+            'High': [103, 102, 101, 99, 96, 93, 91],
+            'Low': [97, 96, 95, 93, 90, 87, 80],
+            'Close': [101, 100, 99, 97, 94, 91, 90],
+            'Volume': [900, 950, 1000, 1050, 1100, 1150, 1200]
+        })
+
+        pattern_recognizer = PatternRecognizer(data_hammer, use_float32=True)
+        recognized_patterns = pattern_recognizer.recognize_patterns()
+
+        assert recognized_patterns['Pattern'].iloc[-1] == 'Hammer'
+
+    def test_recognize_incremental_matches_full_scan(self):
+        rng = np.random.default_rng(1)
+        open_ = 100 + rng.integers(-3, 4, 200).cumsum()
+        close = open_ + rng.integers(-3, 4, 200)
+        data = pd.DataFrame({'Open': open_, 'High': np.maximum(open_, close) + rng.integers(0, 3, 200),
+                             'Low': np.minimum(open_, close) - rng.integers(0, 3, 200), 'Close': close,
+                             'Volume': rng.integers(100, 110, 200)})
+        expected = PatternRecognizer(data.copy()).recognize_patterns()['Pattern']
+
+        pattern_recognizer = PatternRecognizer(data.iloc[:150].copy())
+        pattern_recognizer.recognize_patterns()
+        streamed = [pattern_recognizer.update(candle) for candle in data.iloc[150:].to_dict('records')]
+        assert streamed == expected.iloc[150:].tolist()
+
+        pattern_recognizer = PatternRecognizer(data.copy())
+        pattern_recognizer.recognize_patterns()
+        pattern_recognizer.data.loc[120:, 'Pattern'] = 'stale'
+        assert pattern_recognizer.recognize_patterns(start=120)['Pattern'].equals(expected)
+
+    def test_scan_patterns(self):
+        rng = np.random.default_rng(11)
+        close = 100 + np.cumsum(rng.normal(size=300))
+        open_ = close + rng.normal(scale=0.8, size=300)
+        data = pd.DataFrame({
+            'Open': open_,
+            'High': np.maximum(open_, close) + rng.uniform(0, 1.5, size=300),
+            'Low': np.minimum(open_, close) - rng.uniform(0, 1.5, size=300),
+            'Close': close,
+            'Volume': rng.uniform(1000, 2000, size=300),
+        })
+
+        masks = PatternRecognizer(data.copy()).scan_patterns()
+        labels = PatternRecognizer(data).recognize_patterns()['Pattern']
+
+        assert list(masks.columns) == list(PATTERN_NAMES)
+        first_match = masks.idxmax(axis=1).where(masks.any(axis=1), None)
+        assert first_match.tolist() == labels.tolist()
+
+    def test_recognize_patterns_missing_columns(self):
+        pattern_recognizer = PatternRecognizer(pd.DataFrame({'Open': [1, 2, 3], 'Close': [1, 2, 3]}))
+        with pytest.raises(ValueError, match='High, Low'):
+            pattern_recognizer.recognize_patterns()
+
+    @pytest.mark.parametrize('workers', [None, 2])
+    def test_recognize_batch(self, workers):
+        data_hammer = pd.DataFrame({
+            'Open': [102, 101, 100, 98, 95, 92, 89],
+            'High': [103, 102, 101, 99, 96, 93, 91],
+            'Low': [97, 96, 95, 93, 90, 87, 80],
+            'Close': [101, 100, 99, 97, 94, 91, 90],
+            'Volume': [900, 950, 1000, 1050, 1100, 1150, 1200]
+        })
+        data_morning_star = pd.DataFrame({
+            'Open': [102, 103, 100, 98, 99],
+            'High': [106, 107, 105, 102, 103],
+            'Low': [99, 102, 95, 94, 98],
+            'Close': [104, 105, 96, 98, 102],
+            'Volume': [800, 900, 1000, 500, 1500]
+        })
+
+        results = PatternRecognizer.recognize_batch({'HAM': data_hammer, 'STAR': data_morning_star}, workers=workers)
+
+        assert results['HAM']['Pattern'].iloc[-1] == 'Hammer'
+        assert results['STAR']['Pattern'].iloc[-1] == 'Morning Star'
+        assert 'Pattern' not in data_hammer and 'Pattern' not in data_morning_star
+
+    def test_recognize_patterns_talib(self):
+        pytest.importorskip('talib')
+        data = pd.DataFrame({
+            'Open': [100, 95, 90, 85, 79],
+            'High': [105, 100, 95, 90, 87],
+            'Low': [95, 90, 85, 80, 80],
+            'Close': [96, 91, 86, 82, 91],
+            'Volume': [1000, 1100, 1200, 1300, 1400]
+        })
+        pattern_recognizer = PatternRecognizer(data)
+        recognized_patterns = pattern_recognizer.recognize_patterns(use_talib=True)
+
+        assert recognized_patterns['Pattern'].iloc[-1] == 'Bullish Engulfing'
+
 
 if __name__ == "__main__":
     print(os.getcwd())